@@ -0,0 +1,53 @@
+"""Shared pytest fixtures for the tv_scraper test suite."""
+
+import importlib
+
+import pytest
+
+# (module path, class name) for every HTTP scraper. Classes are resolved on
+# first fixture access so collecting unrelated tests does not import them.
+SCRAPER_CLASS_PATHS: tuple[tuple[str, str], ...] = (
+    ("tv_scraper.scrapers.market_data.technicals", "Technicals"),
+    ("tv_scraper.scrapers.market_data.overview", "Overview"),
+    ("tv_scraper.scrapers.market_data.fundamentals", "Fundamentals"),
+    ("tv_scraper.scrapers.market_data.markets", "Markets"),
+    ("tv_scraper.scrapers.social.ideas", "Ideas"),
+    ("tv_scraper.scrapers.social.minds", "Minds"),
+    ("tv_scraper.scrapers.social.news", "News"),
+    ("tv_scraper.scrapers.screening.screener", "Screener"),
+    ("tv_scraper.scrapers.screening.market_movers", "MarketMovers"),
+    ("tv_scraper.scrapers.screening.symbol_markets", "SymbolMarkets"),
+    ("tv_scraper.scrapers.events.calendar", "Calendar"),
+)
+
+SCRAPER_CLASS_IDS: tuple[str, ...] = tuple(name for _, name in SCRAPER_CLASS_PATHS)
+
+
+def _load_class(path: tuple[str, str]) -> type:
+    module_path, class_name = path
+    cls: type = getattr(importlib.import_module(module_path), class_name)
+    return cls
+
+
+@pytest.fixture(scope="session")
+def all_scraper_classes() -> tuple[type, ...]:
+    """All HTTP scraper classes, imported on first use."""
+    return tuple(_load_class(path) for path in SCRAPER_CLASS_PATHS)
+
+
+@pytest.fixture(scope="session", params=SCRAPER_CLASS_PATHS, ids=SCRAPER_CLASS_IDS)
+def scraper_class(request: pytest.FixtureRequest) -> type:
+    """Each HTTP scraper class in turn, imported on first use."""
+    return _load_class(request.param)
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Block real sockets for tests marked ``no_network``.
+
+    Each such test also gets pytest-socket's ``disable_socket`` marker, so an
+    accidental request escaping a broken patch fails immediately instead of
+    waiting on DNS/TCP. The plugin restores sockets after each test.
+    """
+    for item in items:
+        if item.get_closest_marker("no_network"):
+            item.add_marker(pytest.mark.disable_socket)
@@ -0,0 +1,32 @@
+"""Shared test doubles for the tv_scraper test suite."""
+
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import requests
+
+
+@dataclass(slots=True)
+class FakeResponse:
+    """Minimal stand-in for the ``requests.Response`` attributes scrapers read.
+
+    ``content`` is the raw body, as on a real response: ``text`` encoded when
+    given, otherwise ``payload`` serialized as JSON.
+    """
+
+    payload: Mapping[str, Any] = field(default_factory=dict)
+    status_code: int = 200
+    text: str = ""
+
+    @property
+    def content(self) -> bytes:
+        return (self.text or json.dumps(dict(self.payload))).encode()
+
+    def json(self) -> Mapping[str, Any]:
+        return self.payload
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error")
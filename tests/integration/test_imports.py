@@ -4,188 +4,142 @@ Verifies that all public classes, constants, and exceptions are importable
 from top-level and subpackage paths.
 """
 
+import ast
 import importlib
+import importlib.util
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+pytestmark = pytest.mark.no_network
+
+TOP_LEVEL_NAMES: tuple[str, ...] = (
+    "Technicals",
+    "Overview",
+    "Fundamentals",
+    "Markets",
+    "Ideas",
+    "Minds",
+    "News",
+    "Screener",
+    "MarketMovers",
+    "SymbolMarkets",
+    "Calendar",
+    "Options",
+    "Streamer",
+    "RealTimeData",
+)
+
+SUBPACKAGE_EXPORTS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    (
+        "tv_scraper.scrapers.market_data",
+        ("Fundamentals", "Markets", "Options", "Overview", "Technicals"),
+    ),
+    ("tv_scraper.scrapers.social", ("Ideas", "Minds", "News")),
+    ("tv_scraper.scrapers.screening", ("MarketMovers", "Screener", "SymbolMarkets")),
+    ("tv_scraper.scrapers.events", ("Calendar",)),
+    ("tv_scraper.streaming", ("RealTimeData", "Streamer")),
+)
 
 
 class TestTopLevelImports:
     """All classes listed in tv_scraper.__all__ should be importable directly."""
 
-    def test_import_technicals(self) -> None:
-        from tv_scraper import Technicals
-
-        assert Technicals is not None
-
-    def test_import_overview(self) -> None:
-        from tv_scraper import Overview
-
-        assert Overview is not None
-
-    def test_import_fundamentals(self) -> None:
-        from tv_scraper import Fundamentals
-
-        assert Fundamentals is not None
-
-    def test_import_markets(self) -> None:
-        from tv_scraper import Markets
-
-        assert Markets is not None
-
-    def test_import_ideas(self) -> None:
-        from tv_scraper import Ideas
-
-        assert Ideas is not None
-
-    def test_import_minds(self) -> None:
-        from tv_scraper import Minds
-
-        assert Minds is not None
-
-    def test_import_news(self) -> None:
-        from tv_scraper import News
-
-        assert News is not None
-
-    def test_import_screener(self) -> None:
-        from tv_scraper import Screener
-
-        assert Screener is not None
-
-    def test_import_market_movers(self) -> None:
-        from tv_scraper import MarketMovers
-
-        assert MarketMovers is not None
-
-    def test_import_symbol_markets(self) -> None:
-        from tv_scraper import SymbolMarkets
-
-        assert SymbolMarkets is not None
-
-    def test_import_calendar(self) -> None:
-        from tv_scraper import Calendar
-
-        assert Calendar is not None
-
-    def test_import_options(self) -> None:
-        from tv_scraper import Options
-
-        assert Options is not None
-
-    def test_import_streamer(self) -> None:
-        from tv_scraper import Streamer
-
-        assert Streamer is not None
-
-    def test_import_realtime_data(self) -> None:
-        from tv_scraper import RealTimeData
-
-        assert RealTimeData is not None
+    @pytest.mark.parametrize("name", TOP_LEVEL_NAMES)
+    def test_top_level_name(self, name: str) -> None:
+        module = importlib.import_module("tv_scraper")
+        assert getattr(module, name, None) is not None
 
 
 class TestSubpackageImports:
     """Public classes should also be importable via subpackage paths."""
 
-    def test_import_from_market_data(self) -> None:
-        from tv_scraper.scrapers.market_data import (
-            Fundamentals,
-            Markets,
-            Options,
-            Overview,
-            Technicals,
-        )
-
-        assert all(
-            cls is not None
-            for cls in [Technicals, Overview, Fundamentals, Markets, Options]
-        )
-
-    def test_import_from_social(self) -> None:
-        from tv_scraper.scrapers.social import Ideas, Minds, News
-
-        assert all(cls is not None for cls in [Ideas, Minds, News])
-
-    def test_import_from_screening(self) -> None:
-        from tv_scraper.scrapers.screening import MarketMovers, Screener, SymbolMarkets
-
-        assert all(cls is not None for cls in [Screener, MarketMovers, SymbolMarkets])
-
-    def test_import_from_events(self) -> None:
-        from tv_scraper.scrapers.events import Calendar
-
-        assert Calendar is not None
-
-    def test_import_from_streaming(self) -> None:
-        from tv_scraper.streaming import RealTimeData, Streamer
-
-        assert all(cls is not None for cls in [Streamer, RealTimeData])
+    @pytest.mark.parametrize(
+        ("module_path", "names"),
+        SUBPACKAGE_EXPORTS,
+        ids=[path for path, _ in SUBPACKAGE_EXPORTS],
+    )
+    def test_subpackage_names(self, module_path: str, names: tuple[str, ...]) -> None:
+        module = importlib.import_module(module_path)
+        for name in names:
+            assert getattr(module, name, None) is not None, f"{module_path}.{name}"
+
+
+def _is_tv_scraper_error(value: Any) -> bool:
+    base = importlib.import_module("tv_scraper.core.exceptions").TvScraperError
+    return isinstance(value, type) and issubclass(value, base)
+
+
+CORE_EXPORTS: tuple[tuple[str, str, Callable[[Any], bool]], ...] = (
+    ("tv_scraper.core", "BaseScraper", callable),
+    ("tv_scraper.core", "DataValidator", callable),
+    ("tv_scraper.core", "BASE_URL", lambda v: v.startswith("https://")),
+    ("tv_scraper.core", "STATUS_SUCCESS", lambda v: v == "success"),
+    ("tv_scraper.core", "STATUS_FAILED", lambda v: v == "failed"),
+    ("tv_scraper.core", "DEFAULT_TIMEOUT", lambda v: isinstance(v, int)),
+    ("tv_scraper.core", "DEFAULT_LIMIT", lambda v: isinstance(v, int)),
+    ("tv_scraper.core", "TvScraperError", _is_tv_scraper_error),
+    ("tv_scraper.core", "ValidationError", _is_tv_scraper_error),
+    ("tv_scraper.core", "DataNotFoundError", _is_tv_scraper_error),
+    ("tv_scraper.core", "NetworkError", _is_tv_scraper_error),
+    ("tv_scraper.core", "ExportError", _is_tv_scraper_error),
+)
 
 
 class TestCoreImports:
     """Core module exports should be accessible."""
 
-    def test_import_base_scraper(self) -> None:
-        from tv_scraper.core import BaseScraper
-
-        assert BaseScraper is not None
-
-    def test_import_data_validator(self) -> None:
-        from tv_scraper.core import DataValidator
-
-        assert DataValidator is not None
-
-    def test_import_constants(self) -> None:
-        from tv_scraper.core import (
-            BASE_URL,
-            DEFAULT_LIMIT,
-            DEFAULT_TIMEOUT,
-            STATUS_FAILED,
-            STATUS_SUCCESS,
-        )
+    @pytest.mark.parametrize(
+        ("module_path", "name", "predicate"),
+        CORE_EXPORTS,
+        ids=[name for _, name, _ in CORE_EXPORTS],
+    )
+    def test_core_export(
+        self, module_path: str, name: str, predicate: Callable[[Any], bool]
+    ) -> None:
+        module = importlib.import_module(module_path)
+        assert predicate(getattr(module, name))
 
-        assert BASE_URL.startswith("https://")
-        assert STATUS_SUCCESS == "success"
-        assert STATUS_FAILED == "failed"
-        assert isinstance(DEFAULT_TIMEOUT, int)
-        assert isinstance(DEFAULT_LIMIT, int)
-
-    def test_import_exceptions(self) -> None:
-        from tv_scraper.core import (
-            DataNotFoundError,
-            ExportError,
-            NetworkError,
-            TvScraperError,
-            ValidationError,
-        )
 
-        assert issubclass(ValidationError, TvScraperError)
-        assert issubclass(DataNotFoundError, TvScraperError)
-        assert issubclass(NetworkError, TvScraperError)
-        assert issubclass(ExportError, TvScraperError)
+@pytest.fixture(scope="module")
+def tvs() -> tuple[ModuleType, frozenset[str]]:
+    """The tv_scraper package and its attribute names, computed once."""
+    module = importlib.import_module("tv_scraper")
+    return module, frozenset(dir(module))
 
 
 class TestVersionAndAll:
     """Version string and __all__ list should be correct."""
 
     def test_version_is_1_1_0(self) -> None:
-        import tv_scraper
-
-        assert tv_scraper.__version__ == "1.1.0"
+        # Read __version__ from source so the package itself is not executed.
+        spec = importlib.util.find_spec("tv_scraper")
+        assert spec is not None and spec.origin is not None
+        tree = ast.parse(Path(spec.origin).read_text(encoding="utf-8"))
+        version = next(
+            node.value.value
+            for node in tree.body
+            if isinstance(node, ast.Assign)
+            and any(getattr(t, "id", None) == "__version__" for t in node.targets)
+            and isinstance(node.value, ast.Constant)
+        )
+        assert version == "1.1.0"
 
-    def test_all_exports_match(self) -> None:
+    def test_all_exports_match(self, tvs: tuple[ModuleType, frozenset[str]]) -> None:
         """Every name in __all__ must be importable from tv_scraper."""
-        import tv_scraper
-
-        for name in tv_scraper.__all__:
-            assert hasattr(tv_scraper, name), (
-                f"{name} listed in __all__ not found in tv_scraper"
-            )
+        module, names = tvs
+        missing = sorted(set(module.__all__) - names)
+        assert not missing, f"Listed in __all__ but not found in tv_scraper: {missing}"
 
-    def test_all_count(self) -> None:
+    def test_all_count(self, tvs: tuple[ModuleType, frozenset[str]]) -> None:
         """__all__ should have exactly 14 entries."""
-        import tv_scraper
-
-        assert len(tv_scraper.__all__) == 14
+        module, _ = tvs
+        assert len(module.__all__) == 14
 
-    def test_module_is_importable(self) -> None:
+    def test_module_is_importable(self, tvs: tuple[ModuleType, frozenset[str]]) -> None:
         """tv_scraper should be importable as a module."""
-        mod = importlib.import_module("tv_scraper")
-        assert mod is not None
+        module, _ = tvs
+        assert module is not None
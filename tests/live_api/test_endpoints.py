@@ -4,24 +4,17 @@ These tests make real network requests and are intended for basic
 connectivity and endpoint verification across all modules.
 """
 
+from types import ModuleType
+
 import pytest
 
-from tv_scraper import (
-    Calendar,
-    Fundamentals,
-    Ideas,
-    MarketMovers,
-    Markets,
-    Minds,
-    News,
-    Options,
-    Overview,
-    Screener,
-    Streamer,
-    SymbolMarkets,
-    Technicals,
-)
-from tv_scraper.core.constants import STATUS_FAILED, STATUS_SUCCESS
+
+@pytest.fixture(scope="module")
+def tv() -> ModuleType:
+    """The tv_scraper package, imported only when a live test actually runs."""
+    import tv_scraper
+
+    return tv_scraper
 
 
 @pytest.mark.live
@@ -30,58 +23,58 @@ class TestLiveEndpoints:
 
     # --- Market Data ---
 
-    def test_live_technicals(self) -> None:
+    def test_live_technicals(self, tv: ModuleType) -> None:
         """Verify technicals endpoint is working."""
-        scraper = Technicals()
+        scraper = tv.Technicals()
         result = scraper.get_technicals(
             exchange="NASDAQ", symbol="AAPL", technical_indicators=["RSI"]
         )
-        assert result["status"] == STATUS_SUCCESS
+        assert result["status"] == tv.core.STATUS_SUCCESS
         assert "RSI" in result["data"]
 
-    def test_live_fundamentals(self) -> None:
+    def test_live_fundamentals(self, tv: ModuleType) -> None:
         """Verify fundamentals endpoint is working."""
-        scraper = Fundamentals()
+        scraper = tv.Fundamentals()
         result = scraper.get_fundamentals(
             exchange="NASDAQ", symbol="AAPL", fields=["total_revenue"]
         )
-        assert result["status"] == STATUS_SUCCESS
+        assert result["status"] == tv.core.STATUS_SUCCESS
         assert "total_revenue" in result["data"]
 
-    def test_live_overview(self) -> None:
+    def test_live_overview(self, tv: ModuleType) -> None:
         """Verify overview endpoint is working."""
-        scraper = Overview()
+        scraper = tv.Overview()
         result = scraper.get_overview(
             exchange="NASDAQ", symbol="AAPL", fields=["close"]
         )
-        assert result["status"] == STATUS_SUCCESS
+        assert result["status"] == tv.core.STATUS_SUCCESS
         assert "close" in result["data"]
 
-    def test_live_markets(self) -> None:
+    def test_live_markets(self, tv: ModuleType) -> None:
         """Verify markets (top stocks) endpoint is working."""
-        scraper = Markets()
+        scraper = tv.Markets()
         result = scraper.get_markets(market="india", limit=5)
-        assert result["status"] == STATUS_SUCCESS
+        assert result["status"] == tv.core.STATUS_SUCCESS
         assert len(result["data"]) > 0
 
-    def test_live_options_success(self) -> None:
+    def test_live_options_success(self, tv: ModuleType) -> None:
         """Verify options endpoint is working for a symbol with options."""
-        scraper = Options()
+        scraper = tv.Options()
         # Apple usually has options
         result = scraper.get_options_by_strike(
             exchange="NASDAQ", symbol="AAPL", strike=200
         )
-        assert result["status"] == STATUS_SUCCESS
+        assert result["status"] == tv.core.STATUS_SUCCESS
 
-    def test_live_options_not_found(self) -> None:
+    def test_live_options_not_found(self, tv: ModuleType) -> None:
         """Verify options endpoint returns specific error for symbols without options."""
-        scraper = Options()
+        scraper = tv.Options()
         # BINANCE:BTCUSDT typically does not have traditional option chains here
         result = scraper.get_options_by_strike(
             exchange="BINANCE", symbol="BTCUSDT", strike=100000
         )
         # Should return FAILED because we explicitly checked if data exists
-        assert result["status"] == STATUS_FAILED
+        assert result["status"] == tv.core.STATUS_FAILED
         assert (
             "not found" in result["error"].lower()
             or "no options" in result["error"].lower()
@@ -89,66 +82,66 @@ class TestLiveEndpoints:
 
     # --- Social ---
 
-    def test_live_news(self) -> None:
+    def test_live_news(self, tv: ModuleType) -> None:
         """Verify news endpoint is working."""
-        scraper = News()
+        scraper = tv.News()
         result = scraper.get_news_headlines(exchange="NASDAQ", symbol="AAPL")
-        assert result["status"] == STATUS_SUCCESS
+        assert result["status"] == tv.core.STATUS_SUCCESS
 
-    def test_live_ideas(self) -> None:
+    def test_live_ideas(self, tv: ModuleType) -> None:
         """Verify ideas endpoint is working."""
-        scraper = Ideas()
+        scraper = tv.Ideas()
         result = scraper.get_ideas(exchange="NASDAQ", symbol="AAPL")
         # Might return captcha failure if no cookie, but should not crash
-        assert result["status"] in [STATUS_SUCCESS, STATUS_FAILED]
+        assert result["status"] in [tv.core.STATUS_SUCCESS, tv.core.STATUS_FAILED]
 
-    def test_live_minds(self) -> None:
+    def test_live_minds(self, tv: ModuleType) -> None:
         """Verify minds endpoint is working."""
-        scraper = Minds()
+        scraper = tv.Minds()
         result = scraper.get_minds(exchange="NASDAQ", symbol="AAPL", limit=5)
-        assert result["status"] == STATUS_SUCCESS
+        assert result["status"] == tv.core.STATUS_SUCCESS
 
     # --- Screening ---
 
-    def test_live_screener(self) -> None:
+    def test_live_screener(self, tv: ModuleType) -> None:
         """Verify screener endpoint is working."""
-        scraper = Screener()
+        scraper = tv.Screener()
         result = scraper.get_screener(
             market="america",
             filters=[{"left": "close", "operation": "greater", "right": 100}],
             limit=5,
         )
-        assert result["status"] == STATUS_SUCCESS
+        assert result["status"] == tv.core.STATUS_SUCCESS
 
-    def test_live_market_movers(self) -> None:
+    def test_live_market_movers(self, tv: ModuleType) -> None:
         """Verify market movers endpoint is working."""
-        scraper = MarketMovers()
+        scraper = tv.MarketMovers()
         result = scraper.get_market_movers(
             market="stocks-usa", category="gainers", limit=5
         )
-        assert result["status"] == STATUS_SUCCESS
+        assert result["status"] == tv.core.STATUS_SUCCESS
 
-    def test_live_symbol_markets(self) -> None:
+    def test_live_symbol_markets(self, tv: ModuleType) -> None:
         """Verify symbol markets endpoint is working."""
-        scraper = SymbolMarkets()
+        scraper = tv.SymbolMarkets()
         result = scraper.get_symbol_markets(symbol="AAPL", scanner="america")
-        assert result["status"] == STATUS_SUCCESS
+        assert result["status"] == tv.core.STATUS_SUCCESS
 
     # --- Events ---
 
-    def test_live_calendar(self) -> None:
+    def test_live_calendar(self, tv: ModuleType) -> None:
         """Verify calendar endpoint is working."""
-        scraper = Calendar()
+        scraper = tv.Calendar()
         result = scraper.get_earnings(markets=["america"])
-        assert result["status"] == STATUS_SUCCESS
+        assert result["status"] == tv.core.STATUS_SUCCESS
 
     # --- Streaming (Smoke) ---
 
-    def test_live_streamer_candles(self) -> None:
+    def test_live_streamer_candles(self, tv: ModuleType) -> None:
         """Verify streamer can fetch historic candles."""
-        scraper = Streamer()
+        scraper = tv.Streamer()
         result = scraper.get_candles(
             exchange="NASDAQ", symbol="AAPL", timeframe="1h", numb_candles=5
         )
-        assert result["status"] == STATUS_SUCCESS
+        assert result["status"] == tv.core.STATUS_SUCCESS
         assert len(result["data"]["ohlcv"]) > 0
@@ -1,11 +1,30 @@
 """Tests for BaseScraper class."""
 
-import json
+import http.client
+import math
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 from unittest import mock
 
+import pytest
+import requests
+
+import tv_scraper.utils.http
+from tests.helpers import FakeResponse
 from tv_scraper.core.base import BaseScraper
 from tv_scraper.core.constants import DEFAULT_TIMEOUT, STATUS_FAILED, STATUS_SUCCESS
 
+# Scanner rows shared by the TestMapScannerRows cases; the mapper only reads them.
+_SCANNER_FIELDS = ["close", "change", "volume"]
+_SCANNER_ITEMS: list[dict[str, Any]] = [
+    {"s": "NASDAQ:AAPL", "d": [150.0, 1.5, 1_000_000]},
+    {"s": "NYSE:MSFT", "d": [300.0, -0.5, 2_000_000]},
+]
+_PARTIAL_SCANNER_ITEMS: list[dict[str, Any]] = [{"s": "NASDAQ:AAPL", "d": [150.0]}]
+_UNNAMED_SCANNER_ITEMS: list[dict[str, Any]] = [{"d": [100.0]}]
+
 
 class TestBaseScraperInit:
     """Tests for BaseScraper initialization."""
@@ -44,71 +63,51 @@ class TestBaseScraperInit:
 class TestSuccessResponse:
     """Tests for BaseScraper._success_response()."""
 
-    def test_returns_correct_envelope(self) -> None:
-        scraper = BaseScraper()
-        response = scraper._success_response(data={"key": "value"}, symbol="AAPL")
-        assert response["status"] == STATUS_SUCCESS
-        assert response["data"] == {"key": "value"}
-        assert response["metadata"] == {"symbol": "AAPL"}
-        assert response["error"] is None
-
-    def test_has_exactly_four_keys(self) -> None:
-        scraper = BaseScraper()
-        response = scraper._success_response(data=[1, 2, 3])
-        assert set(response.keys()) == {"status", "data", "metadata", "error"}
-
-    def test_metadata_with_multiple_kwargs(self) -> None:
-        scraper = BaseScraper()
-        response = scraper._success_response(
-            data="test", symbol="AAPL", exchange="NASDAQ", total=10
-        )
-        assert response["metadata"]["symbol"] == "AAPL"
-        assert response["metadata"]["exchange"] == "NASDAQ"
-        assert response["metadata"]["total"] == 10
-
-    def test_empty_metadata(self) -> None:
-        scraper = BaseScraper()
-        response = scraper._success_response(data="test")
-        assert response["metadata"] == {}
-
-    def test_response_is_json_serializable(self) -> None:
+    @pytest.mark.parametrize(
+        ("data", "metadata"),
+        [
+            ({"key": "value"}, {"symbol": "AAPL"}),
+            ([1, 2, 3], {}),
+            ("test", {"symbol": "AAPL", "exchange": "NASDAQ", "total": 10}),
+        ],
+        ids=["single-kwarg", "empty-metadata", "multiple-kwargs"],
+    )
+    def test_returns_correct_envelope(
+        self, data: Any, metadata: dict[str, Any]
+    ) -> None:
         scraper = BaseScraper()
-        response = scraper._success_response(data={"nested": [1, 2]}, symbol="X")
-        serialized = json.dumps(response)
-        assert isinstance(serialized, str)
+        response = scraper._success_response(data=data, **metadata)
+        assert response == {
+            "status": STATUS_SUCCESS,
+            "data": data,
+            "metadata": metadata,
+            "error": None,
+        }
 
 
 class TestErrorResponse:
     """Tests for BaseScraper._error_response()."""
 
-    def test_returns_correct_envelope(self) -> None:
+    @pytest.mark.parametrize(
+        ("error", "metadata"),
+        [
+            ("Something went wrong", {}),
+            ("err", {"symbol": "AAPL"}),
+            ("err", {"symbol": "AAPL", "exchange": "NYSE"}),
+        ],
+        ids=["empty-metadata", "single-kwarg", "multiple-kwargs"],
+    )
+    def test_returns_correct_envelope(
+        self, error: str, metadata: dict[str, Any]
+    ) -> None:
         scraper = BaseScraper()
-        response = scraper._error_response(error="Something went wrong")
-        assert response["status"] == STATUS_FAILED
-        assert response["data"] is None
-        assert response["error"] == "Something went wrong"
-
-    def test_has_exactly_four_keys(self) -> None:
-        scraper = BaseScraper()
-        response = scraper._error_response(error="fail")
-        assert set(response.keys()) == {"status", "data", "metadata", "error"}
-
-    def test_data_is_always_none(self) -> None:
-        scraper = BaseScraper()
-        response = scraper._error_response(error="err", symbol="AAPL")
-        assert response["data"] is None
-
-    def test_metadata_from_kwargs(self) -> None:
-        scraper = BaseScraper()
-        response = scraper._error_response(error="err", symbol="AAPL", exchange="NYSE")
-        assert response["metadata"]["symbol"] == "AAPL"
-        assert response["metadata"]["exchange"] == "NYSE"
-
-    def test_response_is_json_serializable(self) -> None:
-        scraper = BaseScraper()
-        response = scraper._error_response(error="timeout", symbol="X")
-        serialized = json.dumps(response)
-        assert isinstance(serialized, str)
+        response = scraper._error_response(error=error, **metadata)
+        assert response == {
+            "status": STATUS_FAILED,
+            "data": None,
+            "metadata": metadata,
+            "error": error,
+        }
 
 
 class TestMapScannerRows:
@@ -116,12 +115,7 @@ class TestMapScannerRows:
 
     def test_maps_items_to_field_named_dicts(self) -> None:
         scraper = BaseScraper()
-        items = [
-            {"s": "NASDAQ:AAPL", "d": [150.0, 1.5, 1000000]},
-            {"s": "NYSE:MSFT", "d": [300.0, -0.5, 2000000]},
-        ]
-        fields = ["close", "change", "volume"]
-        result = scraper._map_scanner_rows(items, fields)
+        result = scraper._map_scanner_rows(_SCANNER_ITEMS, _SCANNER_FIELDS)
 
         assert len(result) == 2
         assert result[0]["symbol"] == "NASDAQ:AAPL"
@@ -132,9 +126,7 @@ class TestMapScannerRows:
 
     def test_handles_missing_values(self) -> None:
         scraper = BaseScraper()
-        items = [{"s": "NASDAQ:AAPL", "d": [150.0]}]
-        fields = ["close", "change", "volume"]
-        result = scraper._map_scanner_rows(items, fields)
+        result = scraper._map_scanner_rows(_PARTIAL_SCANNER_ITEMS, _SCANNER_FIELDS)
 
         assert result[0]["close"] == 150.0
         assert result[0]["change"] is None
@@ -147,11 +139,28 @@ class TestMapScannerRows:
 
     def test_handles_missing_s_key(self) -> None:
         scraper = BaseScraper()
-        items = [{"d": [100.0]}]
-        fields = ["close"]
-        result = scraper._map_scanner_rows(items, fields)
+        result = scraper._map_scanner_rows(_UNNAMED_SCANNER_ITEMS, ["close"])
         assert result[0]["symbol"] == ""
 
+    def test_rows_do_not_share_the_cached_template(self) -> None:
+        scraper = BaseScraper()
+        first = scraper._map_scanner_rows(_PARTIAL_SCANNER_ITEMS, _SCANNER_FIELDS)
+        first[0]["change"] = "mutated"
+
+        second = scraper._map_scanner_rows(_PARTIAL_SCANNER_ITEMS, _SCANNER_FIELDS)
+        assert second[0]["change"] is None
+
+    def test_maps_field_names_verbatim(self) -> None:
+        scraper = BaseScraper()
+        fields = ["it's", 'a"b', "c}\n"]
+        result = scraper._map_scanner_rows([{"s": "X:Y", "d": [1, 2, 3]}], fields)
+        assert result == [{"symbol": "X:Y", "it's": 1, 'a"b': 2, "c}\n": 3}]
+
+    def test_ignores_values_beyond_fields(self) -> None:
+        scraper = BaseScraper()
+        result = scraper._map_scanner_rows(_SCANNER_ITEMS, ["close"])
+        assert result[0] == {"symbol": "NASDAQ:AAPL", "close": 150.0}
+
 
 class TestExport:
     """Tests for BaseScraper._export()."""
@@ -193,7 +202,7 @@ class TestMakeRequest:
     def test_passes_headers_and_timeout(self) -> None:
         scraper = BaseScraper(timeout=15)
         with mock.patch("tv_scraper.core.base.make_request") as mock_req:
-            mock_req.return_value = mock.MagicMock()
+            mock_req.return_value = FakeResponse()
             scraper._make_request("https://example.com")
             mock_req.assert_called_once()
             call_kwargs = mock_req.call_args
@@ -206,8 +215,152 @@ class TestMakeRequest:
     def test_passes_method(self) -> None:
         scraper = BaseScraper()
         with mock.patch("tv_scraper.core.base.make_request") as mock_req:
-            mock_req.return_value = mock.MagicMock()
+            mock_req.return_value = FakeResponse()
             scraper._make_request("https://example.com", method="POST")
             call_args = mock_req.call_args
             assert call_args[0][0] == "https://example.com"
             assert call_args[1]["method"] == "POST"
+
+
+class TestSession:
+    """Tests for the pooled HTTP sessions used by _make_request()."""
+
+    def test_reuses_one_session_across_sequential_requests(self) -> None:
+        scraper = BaseScraper()
+        with mock.patch("tv_scraper.core.base.make_request") as mock_req:
+            scraper._make_request("https://example.com/a")
+            scraper._make_request("https://example.com/b")
+
+        first, second = (call.kwargs["session"] for call in mock_req.call_args_list)
+        assert first is second
+        assert scraper._idle_sessions == [first]
+
+    def test_concurrent_requests_use_distinct_sessions(self) -> None:
+        scraper = BaseScraper()
+        barrier = threading.Barrier(4)
+        sessions: list[requests.Session] = []
+
+        def _request(url: str, **kwargs: Any) -> FakeResponse:
+            sessions.append(kwargs["session"])
+            barrier.wait(timeout=5)
+            return FakeResponse()
+
+        with (
+            mock.patch("tv_scraper.core.base.make_request", side_effect=_request),
+            ThreadPoolExecutor(max_workers=4) as executor,
+        ):
+            list(executor.map(scraper._make_request, ["https://example.com"] * 4))
+
+        assert len({id(session) for session in sessions}) == 4
+        assert len(scraper._idle_sessions) == 4
+
+    def test_caller_session_is_not_pooled(self) -> None:
+        scraper = BaseScraper()
+        session = requests.Session()
+        with mock.patch("tv_scraper.core.base.make_request") as mock_req:
+            scraper._make_request("https://example.com", session=session)
+
+        assert mock_req.call_args.kwargs["session"] is session
+        assert scraper._idle_sessions == []
+
+    def test_session_returns_to_pool_after_error(self) -> None:
+        scraper = BaseScraper()
+        with (
+            mock.patch(
+                "tv_scraper.core.base.make_request", side_effect=RuntimeError("boom")
+            ),
+            pytest.raises(RuntimeError),
+        ):
+            scraper._make_request("https://example.com")
+
+        assert len(scraper._idle_sessions) == 1
+
+    def test_sessions_do_not_store_cookies(self) -> None:
+        scraper = BaseScraper()
+        session = scraper._acquire_session()
+        request = requests.Request("GET", "https://www.tradingview.com/").prepare()
+        headers = http.client.HTTPMessage()
+        headers["Set-Cookie"] = "sessionid=abc; Path=/"
+        raw = mock.Mock(_original_response=mock.Mock(msg=headers))
+
+        requests.cookies.extract_cookies_to_jar(session.cookies, request, raw)
+
+        assert len(session.cookies) == 0
+
+    def test_close_releases_idle_sessions(self) -> None:
+        scraper = BaseScraper()
+        session = scraper._acquire_session()
+        scraper._idle_sessions.append(session)
+        with mock.patch.object(session, "close") as mock_close:
+            scraper.close()
+
+        mock_close.assert_called_once()
+        assert scraper._idle_sessions == []
+        assert scraper._acquire_session() is not session
+
+    def test_close_without_session_is_noop(self) -> None:
+        scraper = BaseScraper()
+        scraper.close()
+        assert scraper._idle_sessions == []
+
+    def test_pickle_drops_sessions(self) -> None:
+        scraper = BaseScraper()
+        with mock.patch("tv_scraper.core.base.make_request"):
+            scraper._make_request("https://example.com")
+
+        restored = pickle.loads(pickle.dumps(scraper))
+
+        assert restored._idle_sessions == []
+        assert restored.timeout == scraper.timeout
+        assert len(scraper._idle_sessions) == 1
+
+
+def _raw_response(body: bytes) -> requests.Response:
+    """Build a real ``requests.Response`` carrying ``body``."""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    return response
+
+
+class TestIsCaptcha:
+    """Tests for BaseScraper._is_captcha()."""
+
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            (b"<html><title>Captcha Challenge</title></html>", True),
+            (b'{"items": []}', False),
+        ],
+    )
+    def test_checks_raw_body(self, content: bytes, expected: bool) -> None:
+        assert BaseScraper()._is_captcha(_raw_response(content)) is expected
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> str:
+    """Run a test once with orjson (when installed) and once without."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(tv_scraper.utils.http, "orjson", None)
+    return request.param
+
+
+@pytest.mark.usefixtures("json_backend")
+class TestParseJson:
+    """Tests for BaseScraper._parse_json() on both decoding paths."""
+
+    def test_decodes_raw_body(self) -> None:
+        response = _raw_response(b'{"data": [1, 2]}')
+        assert BaseScraper()._parse_json(response) == {"data": [1, 2]}
+
+    def test_accepts_nan(self) -> None:
+        response = _raw_response(b'{"close": NaN}')
+        assert math.isnan(BaseScraper()._parse_json(response)["close"])
+
+    def test_invalid_body_raises_requests_decode_error(self) -> None:
+        with pytest.raises(requests.JSONDecodeError):
+            BaseScraper()._parse_json(_raw_response(b"not json"))
@@ -8,9 +8,9 @@ from tv_scraper.core.base import BaseScraper
 from tv_scraper.core.constants import STATUS_FAILED, STATUS_SUCCESS
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def scraper() -> BaseScraper:
-    """Create a BaseScraper instance for testing."""
+    """Create one BaseScraper shared by every test in this module."""
     return BaseScraper()
 
 
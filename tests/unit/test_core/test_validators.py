@@ -1,6 +1,6 @@
 """Tests for DataValidator singleton."""
 
-from collections.abc import Iterator
+from typing import Any
 
 import pytest
 
@@ -9,11 +9,9 @@ from tv_scraper.core.validators import DataValidator
 
 
 @pytest.fixture(autouse=True)
-def reset_validator() -> Iterator[None]:
+def reset_validator() -> None:
     """Reset DataValidator singleton before each test."""
     DataValidator.reset()
-    yield
-    DataValidator.reset()
 
 
 class TestSingleton:
@@ -34,18 +32,16 @@ class TestSingleton:
 class TestValidateExchange:
     """Tests for validate_exchange()."""
 
-    def test_valid_exchange_returns_true(self) -> None:
-        validator = DataValidator()
-        assert validator.validate_exchange("BINANCE") is True
-
-    def test_valid_exchange_case_insensitive(self) -> None:
+    @pytest.mark.parametrize("exchange", ["BINANCE", "binance", "NASDAQ", "FX_IDC"])
+    def test_valid_exchange_returns_true(self, exchange: str) -> None:
         validator = DataValidator()
-        assert validator.validate_exchange("binance") is True
+        assert validator.validate_exchange(exchange) is True
 
-    def test_invalid_exchange_raises_validation_error(self) -> None:
+    @pytest.mark.parametrize("exchange", ["BINANCEE", "NOT_AN_EXCHANGE"])
+    def test_invalid_exchange_raises_validation_error(self, exchange: str) -> None:
         validator = DataValidator()
         with pytest.raises(ValidationError, match="Invalid exchange"):
-            validator.validate_exchange("BINANCEE")
+            validator.validate_exchange(exchange)
 
     def test_invalid_exchange_suggests_similar(self) -> None:
         validator = DataValidator()
@@ -97,18 +93,16 @@ class TestValidateIndicators:
 class TestValidateTimeframe:
     """Tests for validate_timeframe()."""
 
-    def test_valid_timeframe_returns_true(self) -> None:
+    @pytest.mark.parametrize("timeframe", ["1d", "1h", "5m", "1w"])
+    def test_valid_timeframe_returns_true(self, timeframe: str) -> None:
         validator = DataValidator()
-        assert validator.validate_timeframe("1d") is True
+        assert validator.validate_timeframe(timeframe) is True
 
-    def test_another_valid_timeframe(self) -> None:
-        validator = DataValidator()
-        assert validator.validate_timeframe("1h") is True
-
-    def test_invalid_timeframe_raises_validation_error(self) -> None:
+    @pytest.mark.parametrize("timeframe", ["99x", "", "1D"])
+    def test_invalid_timeframe_raises_validation_error(self, timeframe: str) -> None:
         validator = DataValidator()
         with pytest.raises(ValidationError, match="Invalid timeframe"):
-            validator.validate_timeframe("99x")
+            validator.validate_timeframe(timeframe)
 
 
 class TestValidateChoice:
@@ -144,33 +138,49 @@ class TestValidateFields:
             validator.validate_fields(["x"], ["a", "b"], field_name="columns")
 
 
-class TestGetters:
-    """Tests for getter methods."""
+@pytest.fixture(scope="class")
+def exchanges_list() -> list[str]:
+    """``get_exchanges()`` called once per test class."""
+    return DataValidator().get_exchanges()
 
-    def test_get_exchanges_returns_non_empty_list(self) -> None:
-        validator = DataValidator()
-        exchanges = validator.get_exchanges()
-        assert isinstance(exchanges, list)
-        assert len(exchanges) > 0
 
-    def test_get_indicators_returns_non_empty_list(self) -> None:
-        validator = DataValidator()
-        indicators = validator.get_indicators()
-        assert isinstance(indicators, list)
-        assert len(indicators) > 0
+@pytest.fixture(scope="class")
+def indicators_list() -> list[str]:
+    """``get_indicators()`` called once per test class."""
+    return DataValidator().get_indicators()
 
-    def test_get_timeframes_returns_non_empty_dict(self) -> None:
-        validator = DataValidator()
-        timeframes = validator.get_timeframes()
-        assert isinstance(timeframes, dict)
-        assert len(timeframes) > 0
 
-    def test_exchanges_contains_known_exchange(self) -> None:
-        validator = DataValidator()
-        exchanges = validator.get_exchanges()
-        assert "BINANCE" in exchanges
+@pytest.fixture(scope="class")
+def timeframes_dict() -> dict[str, Any]:
+    """``get_timeframes()`` called once per test class."""
+    return DataValidator().get_timeframes()
 
-    def test_indicators_contains_known_indicator(self) -> None:
-        validator = DataValidator()
-        indicators = validator.get_indicators()
-        assert "RSI" in indicators
+
+class TestGetters:
+    """Tests for getter methods."""
+
+    def test_get_exchanges_returns_non_empty_list(
+        self, exchanges_list: list[str]
+    ) -> None:
+        assert isinstance(exchanges_list, list)
+        assert len(exchanges_list) > 0
+
+    def test_get_indicators_returns_non_empty_list(
+        self, indicators_list: list[str]
+    ) -> None:
+        assert isinstance(indicators_list, list)
+        assert len(indicators_list) > 0
+
+    def test_get_timeframes_returns_non_empty_dict(
+        self, timeframes_dict: dict[str, Any]
+    ) -> None:
+        assert isinstance(timeframes_dict, dict)
+        assert len(timeframes_dict) > 0
+
+    def test_exchanges_contains_known_exchange(self, exchanges_list: list[str]) -> None:
+        assert "BINANCE" in exchanges_list
+
+    def test_indicators_contains_known_indicator(
+        self, indicators_list: list[str]
+    ) -> None:
+        assert "RSI" in indicators_list
@@ -1,30 +1,102 @@
 """Tests for Fundamentals scraper module."""
 
-from collections.abc import Iterator
+from collections.abc import Callable
 from typing import Any
-from unittest import mock
-from unittest.mock import MagicMock
 
 import pytest
 
+from tests.helpers import FakeResponse
 from tv_scraper.core.base import BaseScraper
 from tv_scraper.core.constants import STATUS_FAILED, STATUS_SUCCESS
 from tv_scraper.core.exceptions import NetworkError
 from tv_scraper.scrapers.market_data.fundamentals import Fundamentals
 
 
-@pytest.fixture
-def fundamentals() -> Iterator[Fundamentals]:
-    """Create a Fundamentals instance for testing."""
-    yield Fundamentals()
+@pytest.fixture(scope="module")
+def fundamentals() -> Fundamentals:
+    """Create one Fundamentals instance shared by every test in this module."""
+    return Fundamentals()
+
 
+# Installs canned responses (served in order) or an error on the shared
+# instance and returns the list of recorded request kwargs.
+PatchRequest = Callable[..., list[dict[str, Any]]]
 
-def _mock_response(data: dict[str, Any]) -> MagicMock:
-    """Create a mock requests.Response with a .json() method."""
-    response = MagicMock()
-    response.json.return_value = data
-    response.status_code = 200
-    return response
+
+@pytest.fixture
+def patch_request(
+    fundamentals: Fundamentals, monkeypatch: pytest.MonkeyPatch
+) -> PatchRequest:
+    """Replace ``_make_request`` on the shared Fundamentals for one test."""
+
+    def _patch(
+        *responses: FakeResponse, error: Exception | None = None
+    ) -> list[dict[str, Any]]:
+        calls: list[dict[str, Any]] = []
+        queue = iter(responses)
+
+        def _fake_request(url: str, method: str = "GET", **kwargs: Any) -> Any:
+            calls.append(kwargs)
+            if error is not None:
+                raise error
+            return next(queue)
+
+        monkeypatch.setattr(fundamentals, "_make_request", _fake_request)
+        return calls
+
+    return _patch
+
+
+# Flat payloads as returned by the GET /symbol endpoint, built once at import.
+_AAPL_FULL_PAYLOAD: dict[str, Any] = {
+    "total_revenue": 394_000_000_000,
+    "EBITDA": 130_000_000_000,
+    "market_cap_basic": 2_800_000_000_000,
+}
+_AAPL_CUSTOM_PAYLOAD: dict[str, Any] = {
+    "total_revenue": 394_000_000_000,
+    "net_income": 100_000_000_000,
+    "EBITDA": 130_000_000_000,
+}
+_AAPL_COMPARE_PAYLOAD: dict[str, Any] = {
+    "total_revenue": 394_000_000_000,
+    "net_income": 100_000_000_000,
+    "market_cap_basic": 2_800_000_000_000,
+}
+_MSFT_COMPARE_PAYLOAD: dict[str, Any] = {
+    "total_revenue": 200_000_000_000,
+    "net_income": 70_000_000_000,
+    "market_cap_basic": 2_400_000_000_000,
+}
+_AAPL_REVENUE_PAYLOAD: dict[str, Any] = {"total_revenue": 394_000_000_000}
+
+
+# Compare-test responses keyed by the ``symbol`` query param, built once.
+_COMPARE_RESPONSES: dict[str, FakeResponse] = {
+    "NASDAQ:AAPL": FakeResponse(_AAPL_COMPARE_PAYLOAD),
+    "NASDAQ:MSFT": FakeResponse(_MSFT_COMPARE_PAYLOAD),
+}
+
+
+def _route_by_symbol(
+    url: str, method: str = "GET", *, params: dict[str, str], **kwargs: Any
+) -> FakeResponse:
+    """Serve the canned compare response for the requested symbol."""
+    return _COMPARE_RESPONSES[params["symbol"]]
+
+
+class _Recorder:
+    """Callable stand-in that records its calls and returns a fixed value."""
+
+    __slots__ = ("calls", "return_value")
+
+    def __init__(self, return_value: Any) -> None:
+        self.return_value = return_value
+        self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((args, kwargs))
+        return self.return_value
 
 
 class TestInheritance:
@@ -38,18 +110,13 @@ class TestInheritance:
 class TestGetFundamentalsSuccess:
     """Tests for successful fundamentals retrieval."""
 
-    def test_get_data_success(self, fundamentals: Fundamentals) -> None:
+    def test_get_data_success(
+        self, fundamentals: Fundamentals, patch_request: PatchRequest
+    ) -> None:
         """Get fundamentals with default (all) fields returns success envelope."""
-        # Flat mock response as returned by GET /symbol endpoint
-        mock_data: dict[str, Any] = {
-            "total_revenue": 394000000000,
-            "EBITDA": 130000000000,
-            "market_cap_basic": 2800000000000,
-        }
-        mock_resp = _mock_response(mock_data)
+        patch_request(FakeResponse(_AAPL_FULL_PAYLOAD))
 
-        with mock.patch.object(fundamentals, "_make_request", return_value=mock_resp):
-            result = fundamentals.get_fundamentals(exchange="NASDAQ", symbol="AAPL")
+        result = fundamentals.get_fundamentals(exchange="NASDAQ", symbol="AAPL")
 
         assert result["status"] == STATUS_SUCCESS
         assert result["data"] is not None
@@ -58,22 +125,16 @@ class TestGetFundamentalsSuccess:
         assert result["data"]["total_revenue"] == 394000000000
         assert result["data"]["EBITDA"] == 130000000000
 
-    def test_get_data_with_custom_fields(self, fundamentals: Fundamentals) -> None:
+    def test_get_data_with_custom_fields(
+        self, fundamentals: Fundamentals, patch_request: PatchRequest
+    ) -> None:
         """Custom fields are sent to the API and returned correctly."""
         custom_fields = ["total_revenue", "net_income", "EBITDA"]
-        mock_data: dict[str, Any] = {
-            "total_revenue": 394000000000,
-            "net_income": 100000000000,
-            "EBITDA": 130000000000,
-        }
-        mock_resp = _mock_response(mock_data)
+        calls = patch_request(FakeResponse(_AAPL_CUSTOM_PAYLOAD))
 
-        with mock.patch.object(
-            fundamentals, "_make_request", return_value=mock_resp
-        ) as mock_req:
-            result = fundamentals.get_fundamentals(
-                exchange="NASDAQ", symbol="AAPL", fields=custom_fields
-            )
+        result = fundamentals.get_fundamentals(
+            exchange="NASDAQ", symbol="AAPL", fields=custom_fields
+        )
 
         assert result["status"] == STATUS_SUCCESS
         assert result["data"]["total_revenue"] == 394000000000
@@ -81,8 +142,7 @@ class TestGetFundamentalsSuccess:
         assert result["data"]["EBITDA"] == 130000000000
 
         # Verify correct params sent to API (GET uses params, not json_data)
-        call_kwargs = mock_req.call_args[1]
-        params = call_kwargs["params"]
+        params = calls[0]["params"]
         assert params["symbol"] == "NASDAQ:AAPL"
         assert params["fields"] == ",".join(custom_fields)
 
@@ -90,167 +150,102 @@ class TestGetFundamentalsSuccess:
 class TestGetFundamentalsErrors:
     """Tests for error handling — returns error responses, never raises."""
 
-    def test_get_data_invalid_exchange(self, fundamentals: Fundamentals) -> None:
-        """Invalid exchange returns error response, does not raise."""
-        result = fundamentals.get_fundamentals(
-            exchange="INVALID_EXCHANGE", symbol="AAPL"
-        )
-        assert result["status"] == STATUS_FAILED
-        assert result["data"] is None
-        assert "Invalid exchange" in result["error"]
+    @pytest.mark.parametrize(
+        ("exchange", "symbol", "error", "expected_error"),
+        [
+            pytest.param(
+                "INVALID_EXCHANGE",
+                "AAPL",
+                None,
+                "Invalid exchange",
+                id="invalid_exchange",
+            ),
+            pytest.param("NASDAQ", "", None, "", id="empty_symbol"),
+            pytest.param(
+                "NASDAQ",
+                "AAPL",
+                NetworkError("Connection refused"),
+                "Connection refused",
+                id="network_error",
+            ),
+        ],
+    )
+    def test_get_data_error_paths(
+        self,
+        *,
+        fundamentals: Fundamentals,
+        patch_request: PatchRequest,
+        exchange: str,
+        symbol: str,
+        error: Exception | None,
+        expected_error: str,
+    ) -> None:
+        """Invalid input or network errors return an error response, never raise."""
+        if error is not None:
+            patch_request(error=error)
+
+        result = fundamentals.get_fundamentals(exchange=exchange, symbol=symbol)
 
-    def test_get_data_empty_symbol(self, fundamentals: Fundamentals) -> None:
-        """Empty symbol returns error response."""
-        result = fundamentals.get_fundamentals(exchange="NASDAQ", symbol="")
         assert result["status"] == STATUS_FAILED
         assert result["data"] is None
         assert result["error"] is not None
-
-    def test_get_data_network_error(self, fundamentals: Fundamentals) -> None:
-        """Network error returns error response, does not raise."""
-        with mock.patch.object(
-            fundamentals,
-            "_make_request",
-            side_effect=NetworkError("Connection refused"),
-        ):
-            result = fundamentals.get_fundamentals(exchange="NASDAQ", symbol="AAPL")
-        assert result["status"] == STATUS_FAILED
-        assert result["data"] is None
-        assert "Connection refused" in result["error"]
+        assert expected_error in result["error"]
 
 
 class TestCategoryMethods:
     """Tests for convenience category methods."""
 
-    def test_get_income_statement(self, fundamentals: Fundamentals) -> None:
-        """get_income_statement passes INCOME_STATEMENT_FIELDS."""
-        with mock.patch.object(fundamentals, "get_fundamentals") as mock_get:
-            mock_get.return_value = fundamentals._success_response(
-                {"total_revenue": 394000000000},
-                exchange="NASDAQ",
-                symbol="AAPL",
-            )
-            result = fundamentals.get_income_statement(exchange="NASDAQ", symbol="AAPL")
-
-        mock_get.assert_called_once_with(
-            exchange="NASDAQ",
-            symbol="AAPL",
-            fields=Fundamentals.INCOME_STATEMENT_FIELDS,
+    @pytest.mark.parametrize(
+        ("method_name", "expected_fields"),
+        [
+            ("get_income_statement", Fundamentals.INCOME_STATEMENT_FIELDS),
+            ("get_balance_sheet", Fundamentals.BALANCE_SHEET_FIELDS),
+            ("get_cash_flow", Fundamentals.CASH_FLOW_FIELDS),
+            (
+                "get_statistics",
+                Fundamentals.LIQUIDITY_FIELDS
+                + Fundamentals.LEVERAGE_FIELDS
+                + Fundamentals.VALUATION_FIELDS,
+            ),
+            ("get_dividends", Fundamentals.DIVIDEND_FIELDS),
+            ("get_profitability", Fundamentals.PROFITABILITY_FIELDS),
+            ("get_margins", Fundamentals.MARGIN_FIELDS),
+        ],
+    )
+    def test_category_method_passes_fields(
+        self,
+        fundamentals: Fundamentals,
+        monkeypatch: pytest.MonkeyPatch,
+        method_name: str,
+        expected_fields: tuple[str, ...],
+    ) -> None:
+        """Each category method forwards its field list to get_fundamentals."""
+        recorder = _Recorder(
+            fundamentals._success_response({}, exchange="NASDAQ", symbol="AAPL")
         )
-        assert result["status"] == STATUS_SUCCESS
+        monkeypatch.setattr(fundamentals, "get_fundamentals", recorder)
 
-    def test_get_balance_sheet(self, fundamentals: Fundamentals) -> None:
-        """get_balance_sheet passes BALANCE_SHEET_FIELDS."""
-        with mock.patch.object(fundamentals, "get_fundamentals") as mock_get:
-            mock_get.return_value = fundamentals._success_response(
-                {"total_assets": 350000000000},
-                exchange="NASDAQ",
-                symbol="AAPL",
-            )
-            result = fundamentals.get_balance_sheet(exchange="NASDAQ", symbol="AAPL")
-
-        mock_get.assert_called_once_with(
-            exchange="NASDAQ",
-            symbol="AAPL",
-            fields=Fundamentals.BALANCE_SHEET_FIELDS,
-        )
-        assert result["status"] == STATUS_SUCCESS
+        result = getattr(fundamentals, method_name)(exchange="NASDAQ", symbol="AAPL")
 
-    def test_get_cash_flow(self, fundamentals: Fundamentals) -> None:
-        """get_cash_flow passes CASH_FLOW_FIELDS."""
-        with mock.patch.object(fundamentals, "get_fundamentals") as mock_get:
-            mock_get.return_value = fundamentals._success_response(
-                {"free_cash_flow": 85000000000},
-                exchange="NASDAQ",
-                symbol="AAPL",
-            )
-            result = fundamentals.get_cash_flow(exchange="NASDAQ", symbol="AAPL")
-
-        mock_get.assert_called_once_with(
-            exchange="NASDAQ",
-            symbol="AAPL",
-            fields=Fundamentals.CASH_FLOW_FIELDS,
-        )
-        assert result["status"] == STATUS_SUCCESS
-
-    def test_get_statistics(self, fundamentals: Fundamentals) -> None:
-        """get_statistics passes combined liquidity + leverage + valuation fields."""
-        expected_fields = (
-            Fundamentals.LIQUIDITY_FIELDS
-            + Fundamentals.LEVERAGE_FIELDS
-            + Fundamentals.VALUATION_FIELDS
-        )
-        with mock.patch.object(fundamentals, "get_fundamentals") as mock_get:
-            mock_get.return_value = fundamentals._success_response(
-                {"current_ratio": 1.1},
-                exchange="NASDAQ",
-                symbol="AAPL",
-            )
-            result = fundamentals.get_statistics(exchange="NASDAQ", symbol="AAPL")
-
-        mock_get.assert_called_once_with(
-            exchange="NASDAQ",
-            symbol="AAPL",
-            fields=expected_fields,
-        )
+        assert recorder.calls == [
+            ((), {"exchange": "NASDAQ", "symbol": "AAPL", "fields": expected_fields})
+        ]
         assert result["status"] == STATUS_SUCCESS
 
-    def test_get_dividends(self, fundamentals: Fundamentals) -> None:
-        """get_dividends passes DIVIDEND_FIELDS."""
-        with mock.patch.object(fundamentals, "get_fundamentals") as mock_get:
-            mock_get.return_value = fundamentals._success_response(
-                {"dividends_yield": 0.65},
-                exchange="NASDAQ",
-                symbol="AAPL",
-            )
-            result = fundamentals.get_dividends(exchange="NASDAQ", symbol="AAPL")
-
-        mock_get.assert_called_once_with(
-            exchange="NASDAQ",
-            symbol="AAPL",
-            fields=Fundamentals.DIVIDEND_FIELDS,
-        )
-        assert result["status"] == STATUS_SUCCESS
-
-    def test_get_profitability(self, fundamentals: Fundamentals) -> None:
-        """get_profitability passes PROFITABILITY_FIELDS."""
-        with mock.patch.object(fundamentals, "get_fundamentals") as mock_get:
-            mock_get.return_value = fundamentals._success_response(
-                {"return_on_equity": 150.0},
-                exchange="NASDAQ",
-                symbol="AAPL",
-            )
-            result = fundamentals.get_profitability(exchange="NASDAQ", symbol="AAPL")
-
-        mock_get.assert_called_once_with(
-            exchange="NASDAQ",
-            symbol="AAPL",
-            fields=Fundamentals.PROFITABILITY_FIELDS,
-        )
-        assert result["status"] == STATUS_SUCCESS
-
-    def test_get_margins(self, fundamentals: Fundamentals) -> None:
-        """get_margins passes MARGIN_FIELDS."""
-        with mock.patch.object(fundamentals, "get_fundamentals") as mock_get:
-            mock_get.return_value = fundamentals._success_response(
-                {"gross_margin": 43.0},
-                exchange="NASDAQ",
-                symbol="AAPL",
-            )
-            result = fundamentals.get_margins(exchange="NASDAQ", symbol="AAPL")
-
-        mock_get.assert_called_once_with(
-            exchange="NASDAQ",
-            symbol="AAPL",
-            fields=Fundamentals.MARGIN_FIELDS,
-        )
-        assert result["status"] == STATUS_SUCCESS
+    @pytest.mark.parametrize(
+        "name", [name for name in vars(Fundamentals) if name.endswith("_FIELDS")]
+    )
+    def test_field_groups_are_tuples(self, name: str) -> None:
+        """Public field groups are immutable tuples, not lists."""
+        assert isinstance(getattr(Fundamentals, name), tuple)
 
 
 class TestCompareFundamentals:
     """Tests for multi-symbol comparison."""
 
-    def test_compare_fundamentals_success(self, fundamentals: Fundamentals) -> None:
+    def test_compare_fundamentals_success(
+        self, fundamentals: Fundamentals, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """compare_fundamentals with valid symbols returns comparison data."""
         symbols: list[dict[str, str]] = [
             {"exchange": "NASDAQ", "symbol": "AAPL"},
@@ -258,28 +253,11 @@ class TestCompareFundamentals:
         ]
         custom_fields = ["total_revenue", "net_income", "market_cap_basic"]
 
-        # Flat mock responses
-        aapl_resp = _mock_response(
-            {
-                "total_revenue": 394000000000,
-                "net_income": 100000000000,
-                "market_cap_basic": 2800000000000,
-            }
-        )
-        msft_resp = _mock_response(
-            {
-                "total_revenue": 200000000000,
-                "net_income": 70000000000,
-                "market_cap_basic": 2400000000000,
-            }
-        )
+        monkeypatch.setattr(fundamentals, "_make_request", _route_by_symbol)
 
-        with mock.patch.object(
-            fundamentals, "_make_request", side_effect=[aapl_resp, msft_resp]
-        ):
-            result = fundamentals.compare_fundamentals(
-                symbols=symbols, fields=custom_fields
-            )
+        result = fundamentals.compare_fundamentals(
+            symbols=symbols, fields=custom_fields
+        )
 
         assert result["status"] == STATUS_SUCCESS
         assert result["data"] is not None
@@ -290,7 +268,10 @@ class TestCompareFundamentals:
         assert "items" in data
         assert "comparison" in data
         assert len(data["items"]) == 2
-        assert "total_revenue" in data["comparison"]
+        assert data["comparison"]["total_revenue"] == {
+            "NASDAQ:AAPL": 394_000_000_000,
+            "NASDAQ:MSFT": 200_000_000_000,
+        }
 
     def test_compare_fundamentals_empty_list(self, fundamentals: Fundamentals) -> None:
         """Empty symbols list returns error response."""
@@ -303,13 +284,15 @@ class TestCompareFundamentals:
 class TestResponseFormat:
     """Tests for response envelope structure."""
 
-    def test_response_has_standard_envelope(self, fundamentals: Fundamentals) -> None:
+    def test_response_has_standard_envelope(
+        self, fundamentals: Fundamentals, patch_request: PatchRequest
+    ) -> None:
         """Response contains exactly status/data/metadata/error keys."""
-        mock_resp = _mock_response({"total_revenue": 394000000000})
-        with mock.patch.object(fundamentals, "_make_request", return_value=mock_resp):
-            result = fundamentals.get_fundamentals(
-                exchange="NASDAQ", symbol="AAPL", fields=["total_revenue"]
-            )
+        patch_request(FakeResponse(_AAPL_REVENUE_PAYLOAD))
+
+        result = fundamentals.get_fundamentals(
+            exchange="NASDAQ", symbol="AAPL", fields=["total_revenue"]
+        )
         assert set(result.keys()) == {"status", "data", "metadata", "error"}
         assert result["metadata"]["exchange"] == "NASDAQ"
         assert result["metadata"]["symbol"] == "AAPL"
@@ -1,11 +1,13 @@
 """Tests for Ideas scraper module."""
 
-from collections.abc import Iterator
+import time
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 
+from tests.helpers import FakeResponse
 from tv_scraper.core.base import BaseScraper
 from tv_scraper.core.constants import STATUS_FAILED, STATUS_SUCCESS
 from tv_scraper.scrapers.social.ideas import Ideas
@@ -47,23 +49,24 @@ def _sample_idea(
     }
 
 
-def _mock_response(
-    json_data: dict[str, Any],
-    status_code: int = 200,
-    text: str = "",
-) -> MagicMock:
-    """Create a mock requests.Response."""
-    resp = MagicMock()
-    resp.status_code = status_code
-    resp.text = text
-    resp.json.return_value = json_data
-    return resp
+IDEAS_PAYLOAD_SINGLE = _make_api_response([_sample_idea()])
+IDEAS_PAYLOAD_POPULAR = _make_api_response([_sample_idea(title="Bull Run Coming")])
+IDEAS_PAYLOAD_RECENT = _make_api_response([_sample_idea(title="Latest Analysis")])
+IDEAS_PAYLOAD_EMPTY = _make_api_response([])
 
 
-@pytest.fixture
-def ideas() -> Iterator[Ideas]:
-    """Create an Ideas instance for testing."""
-    yield Ideas()
+@pytest.fixture(autouse=True)
+def mock_get(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace ``BaseScraper._make_request`` with a mock for every test."""
+    mock = MagicMock()
+    monkeypatch.setattr(BaseScraper, "_make_request", mock)
+    return mock
+
+
+@pytest.fixture(scope="class")
+def ideas() -> Ideas:
+    """Create one Ideas instance per test class; all HTTP calls are mocked."""
+    return Ideas()
 
 
 class TestInheritance:
@@ -77,12 +80,9 @@ class TestInheritance:
 class TestScrapeSuccess:
     """Tests for successful idea scraping."""
 
-    @patch("tv_scraper.core.base.BaseScraper._make_request")
     def test_get_data_success_popular(self, mock_get: MagicMock, ideas: Ideas) -> None:
         """Scrape popular ideas returns success envelope with mapped fields."""
-        mock_get.return_value = _mock_response(
-            _make_api_response([_sample_idea(title="Bull Run Coming")])
-        )
+        mock_get.return_value = FakeResponse(IDEAS_PAYLOAD_POPULAR)
 
         result = ideas.get_ideas(exchange="CRYPTO", symbol="BTCUSD", sort_by="popular")
 
@@ -101,12 +101,9 @@ class TestScrapeSuccess:
         assert idea["chart_url"] == "https://www.tradingview.com/chart/BTCUSD/abc123"
         assert idea["preview_image"] == ["https://example.com/logo.png"]
 
-    @patch("tv_scraper.core.base.BaseScraper._make_request")
     def test_get_data_success_recent(self, mock_get: MagicMock, ideas: Ideas) -> None:
         """Scrape recent ideas passes sort=recent to API and returns data."""
-        mock_get.return_value = _mock_response(
-            _make_api_response([_sample_idea(title="Latest Analysis")])
-        )
+        mock_get.return_value = FakeResponse(IDEAS_PAYLOAD_RECENT)
 
         result = ideas.get_ideas(exchange="CRYPTO", symbol="BTCUSD", sort_by="recent")
 
@@ -116,13 +113,15 @@ class TestScrapeSuccess:
 
         # Verify 'sort=recent' was included in the API call params
         call_kwargs = mock_get.call_args
-        params = call_kwargs[1].get("params", call_kwargs.kwargs.get("params", {}))
+        params = call_kwargs.kwargs["params"]
         assert params.get("sort") == "recent"
 
-    @patch("tv_scraper.core.base.BaseScraper._make_request")
     def test_get_data_multiple_pages(self, mock_get: MagicMock, ideas: Ideas) -> None:
         """Multi-page get_data with ThreadPoolExecutor returns combined results."""
-        mock_get.return_value = _mock_response(_make_api_response([_sample_idea()]))
+        mock_get.side_effect = [
+            FakeResponse(_make_api_response([_sample_idea(title=f"Page {page}")]))
+            for page in (1, 2, 3)
+        ]
 
         result = ideas.get_ideas(
             exchange="CRYPTO",
@@ -135,13 +134,48 @@ class TestScrapeSuccess:
         assert result["status"] == STATUS_SUCCESS
         # 3 pages x 1 idea each = 3 ideas
         assert len(result["data"]) == 3
+        assert {idea["title"] for idea in result["data"]} == {
+            "Page 1",
+            "Page 2",
+            "Page 3",
+        }
         assert mock_get.call_count == 3
+        assert {call.args[0] for call in mock_get.call_args_list} == {
+            "https://www.tradingview.com/symbols/CRYPTO-BTCUSD/ideas/",
+            "https://www.tradingview.com/symbols/CRYPTO-BTCUSD/ideas/page-2/",
+            "https://www.tradingview.com/symbols/CRYPTO-BTCUSD/ideas/page-3/",
+        }
         assert result["metadata"]["pages"] == 3
 
-    @patch("tv_scraper.core.base.BaseScraper._make_request")
+    def test_get_data_multiple_pages_keeps_page_order(
+        self, mock_get: MagicMock, ideas: Ideas
+    ) -> None:
+        """Ideas are returned in page order whatever order pages finish in."""
+        base = "https://www.tradingview.com/symbols/CRYPTO-BTCUSD/ideas/"
+        pages = {
+            base: FakeResponse(_make_api_response([_sample_idea(title="Page 1")])),
+            f"{base}page-2/": FakeResponse(
+                _make_api_response([_sample_idea(title="Page 2")])
+            ),
+            f"{base}page-3/": FakeResponse(
+                _make_api_response([_sample_idea(title="Page 3")])
+            ),
+        }
+        mock_get.side_effect = lambda url, **kwargs: pages[url]
+
+        result = ideas.get_ideas(
+            exchange="CRYPTO", symbol="BTCUSD", start_page=1, end_page=3
+        )
+
+        assert [idea["title"] for idea in result["data"]] == [
+            "Page 1",
+            "Page 2",
+            "Page 3",
+        ]
+
     def test_get_data_no_data(self, mock_get: MagicMock, ideas: Ideas) -> None:
         """Empty items list returns success with empty data list."""
-        mock_get.return_value = _mock_response(_make_api_response([]))
+        mock_get.return_value = FakeResponse(IDEAS_PAYLOAD_EMPTY)
 
         result = ideas.get_ideas(exchange="CRYPTO", symbol="BTCUSD")
 
@@ -171,7 +205,6 @@ class TestScrapeErrors:
         assert result["data"] is None
         assert result["error"] is not None
 
-    @patch("tv_scraper.core.base.BaseScraper._make_request")
     def test_get_data_network_error(self, mock_get: MagicMock, ideas: Ideas) -> None:
         """Network/request failure returns error response, does not raise."""
         mock_get.side_effect = Exception("Connection refused")
@@ -182,11 +215,10 @@ class TestScrapeErrors:
         assert result["data"] is None
         assert result["error"] is not None
 
-    @patch("tv_scraper.core.base.BaseScraper._make_request")
     def test_get_data_captcha_detected(self, mock_get: MagicMock, ideas: Ideas) -> None:
         """Captcha challenge in response returns error response."""
-        captcha_resp = _mock_response(
-            _make_api_response([]),
+        captcha_resp = FakeResponse(
+            IDEAS_PAYLOAD_EMPTY,
             text="<title>Captcha Challenge</title>",
         )
         mock_get.return_value = captcha_resp
@@ -197,16 +229,63 @@ class TestScrapeErrors:
         assert result["data"] is None
         assert "captcha" in result["error"].lower()
 
+    def test_get_data_captcha_in_raw_body(
+        self, mock_get: MagicMock, ideas: Ideas
+    ) -> None:
+        """A captcha page is detected from the raw body of a real response."""
+        captcha_resp = requests.Response()
+        captcha_resp.status_code = 200
+        captcha_resp._content = (
+            b"<html><head><title>Captcha Challenge</title></head></html>"
+        )
+        mock_get.return_value = captcha_resp
+
+        result = ideas.get_ideas(exchange="CRYPTO", symbol="BTCUSD")
+
+        assert result["status"] == STATUS_FAILED
+        assert result["data"] is None
+        assert "captcha" in result["error"].lower()
+
+    def test_get_data_failed_page_stops_remaining_pages(
+        self, mock_get: MagicMock, ideas: Ideas, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A failed page cancels queued pages and waits for in-flight ones."""
+        monkeypatch.setattr("tv_scraper.scrapers.social.ideas.MAX_PAGE_WORKERS", 2)
+        first_page = "https://www.tradingview.com/symbols/CRYPTO-BTCUSD/ideas/"
+        started: list[str] = []
+        finished: list[str] = []
+
+        def _respond(url: str, **kwargs: Any) -> FakeResponse:
+            started.append(url)
+            if url == first_page:
+                return FakeResponse(status_code=500)
+            time.sleep(0.05)
+            finished.append(url)
+            return FakeResponse(_make_api_response([_sample_idea()]))
+
+        mock_get.side_effect = _respond
+
+        result = ideas.get_ideas(
+            exchange="CRYPTO", symbol="BTCUSD", start_page=1, end_page=6
+        )
+
+        assert result["status"] == STATUS_FAILED
+        assert result["data"] is None
+        assert "page 1" in result["error"]
+        # Queued pages were never requested...
+        assert len(started) < 6
+        # ...and every page that did start had finished before get_ideas returned.
+        assert sorted(finished) == sorted(url for url in started if url != first_page)
+
 
 class TestResponseFormat:
     """Tests for response envelope structure."""
 
-    @patch("tv_scraper.core.base.BaseScraper._make_request")
     def test_response_has_standard_envelope(
         self, mock_get: MagicMock, ideas: Ideas
     ) -> None:
         """Response contains exactly status/data/metadata/error keys."""
-        mock_get.return_value = _mock_response(_make_api_response([_sample_idea()]))
+        mock_get.return_value = FakeResponse(IDEAS_PAYLOAD_SINGLE)
 
         result = ideas.get_ideas(exchange="CRYPTO", symbol="BTCUSD")
 
@@ -215,10 +294,9 @@ class TestResponseFormat:
         assert result["metadata"]["exchange"] == "CRYPTO"
         assert "total" in result["metadata"]
 
-    @patch("tv_scraper.core.base.BaseScraper._make_request")
     def test_snake_case_params(self, mock_get: MagicMock, ideas: Ideas) -> None:
         """Verify snake_case parameter names are accepted."""
-        mock_get.return_value = _mock_response(_make_api_response([_sample_idea()]))
+        mock_get.return_value = FakeResponse(IDEAS_PAYLOAD_SINGLE)
 
         # These should all be valid snake_case param names (no camelCase)
         result = ideas.get_ideas(
@@ -235,28 +313,26 @@ class TestResponseFormat:
 class TestCookieHandling:
     """Tests for cookie authentication."""
 
-    @patch("tv_scraper.core.base.BaseScraper._make_request")
     def test_cookie_header_applied(self, mock_get: MagicMock) -> None:
         """Cookie passed in constructor is sent as request header."""
         cookie_value = "sessionid=abc123; _sp_id=xyz789"
         scraper = Ideas(cookie=cookie_value)
-        mock_get.return_value = _mock_response(_make_api_response([_sample_idea()]))
+        mock_get.return_value = FakeResponse(IDEAS_PAYLOAD_SINGLE)
 
         scraper.get_ideas(exchange="CRYPTO", symbol="BTCUSD")
 
         call_kwargs = mock_get.call_args
-        headers = call_kwargs[1].get("headers", call_kwargs.kwargs.get("headers", {}))
+        headers = call_kwargs.kwargs["headers"]
         assert headers.get("cookie") == cookie_value
 
     @patch.dict("os.environ", {"TRADINGVIEW_COOKIE": "env_cookie_value"})
-    @patch("tv_scraper.core.base.BaseScraper._make_request")
     def test_cookie_from_env_var(self, mock_get: MagicMock) -> None:
         """Cookie loaded from TRADINGVIEW_COOKIE env var when not passed directly."""
         scraper = Ideas()
-        mock_get.return_value = _mock_response(_make_api_response([_sample_idea()]))
+        mock_get.return_value = FakeResponse(IDEAS_PAYLOAD_SINGLE)
 
         scraper.get_ideas(exchange="CRYPTO", symbol="BTCUSD")
 
         call_kwargs = mock_get.call_args
-        headers = call_kwargs[1].get("headers", call_kwargs.kwargs.get("headers", {}))
+        headers = call_kwargs.kwargs["headers"]
         assert headers.get("cookie") == "env_cookie_value"
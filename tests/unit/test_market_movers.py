@@ -6,6 +6,7 @@ from unittest import mock
 
 import pytest
 
+from tests.helpers import FakeResponse
 from tv_scraper.core.base import BaseScraper
 from tv_scraper.core.exceptions import NetworkError
 from tv_scraper.scrapers.screening.market_movers import MarketMovers
@@ -17,19 +18,22 @@ def scraper() -> Iterator[MarketMovers]:
     yield MarketMovers(export_result=False)
 
 
+@pytest.fixture(autouse=True)
+def mock_req(monkeypatch: pytest.MonkeyPatch) -> mock.Mock:
+    """Replace ``make_request`` for every test; inject it to set responses."""
+    fake = mock.Mock()
+    monkeypatch.setattr("tv_scraper.core.base.make_request", fake)
+    return fake
+
+
 def _mock_scanner_response(
     symbols: list[str],
     fields: list[str],
     values: list[list[Any]],
-) -> mock.Mock:
-    """Build a mock response matching the TradingView scanner format."""
-    data = []
-    for sym, vals in zip(symbols, values, strict=True):
-        data.append({"s": sym, "d": vals})
-    resp = mock.Mock()
-    resp.status_code = 200
-    resp.json.return_value = {"data": data, "totalCount": len(data)}
-    return resp
+) -> FakeResponse:
+    """Build a response matching the TradingView scanner format."""
+    data = [{"s": sym, "d": vals} for sym, vals in zip(symbols, values, strict=True)]
+    return FakeResponse({"data": data, "totalCount": len(data)})
 
 
 # ---------- Inheritance ----------
@@ -45,7 +49,6 @@ class TestInheritance:
 
 
 class TestScrapeSuccess:
-    @mock.patch("tv_scraper.core.base.make_request")
     def test_get_data_success_gainers(
         self, mock_req: mock.Mock, scraper: MarketMovers
     ) -> None:
@@ -91,7 +94,6 @@ class TestScrapeSuccess:
         assert result["data"][0]["name"] == "Apple Inc."
         assert result["data"][1]["symbol"] == "NASDAQ:MSFT"
 
-    @mock.patch("tv_scraper.core.base.make_request")
     def test_get_data_success_losers(
         self, mock_req: mock.Mock, scraper: MarketMovers
     ) -> None:
@@ -124,10 +126,9 @@ class TestScrapeSuccess:
 
         # Verify the payload sort order was "asc" for losers
         call_kwargs = mock_req.call_args
-        payload = call_kwargs.kwargs.get("json_data") or call_kwargs[1].get("json_data")
+        payload = call_kwargs.kwargs["json_data"]
         assert payload["sort"]["sortOrder"] == "asc"
 
-    @mock.patch("tv_scraper.core.base.make_request")
     def test_get_data_success_active(
         self, mock_req: mock.Mock, scraper: MarketMovers
     ) -> None:
@@ -158,7 +159,7 @@ class TestScrapeSuccess:
 
         # Verify sort config
         call_kwargs = mock_req.call_args
-        payload = call_kwargs.kwargs.get("json_data") or call_kwargs[1].get("json_data")
+        payload = call_kwargs.kwargs["json_data"]
         assert payload["sort"]["sortBy"] == "volume"
         assert payload["sort"]["sortOrder"] == "desc"
 
@@ -167,7 +168,6 @@ class TestScrapeSuccess:
 
 
 class TestCustomFieldsAndLimit:
-    @mock.patch("tv_scraper.core.base.make_request")
     def test_get_data_custom_fields(
         self, mock_req: mock.Mock, scraper: MarketMovers
     ) -> None:
@@ -189,10 +189,9 @@ class TestCustomFieldsAndLimit:
         assert result["data"][0]["name"] == "IBM Corp"
         # Verify the payload used custom fields
         call_kwargs = mock_req.call_args
-        payload = call_kwargs.kwargs.get("json_data") or call_kwargs[1].get("json_data")
+        payload = call_kwargs.kwargs["json_data"]
         assert payload["columns"] == custom_fields
 
-    @mock.patch("tv_scraper.core.base.make_request")
     def test_get_data_with_limit(
         self, mock_req: mock.Mock, scraper: MarketMovers
     ) -> None:
@@ -219,7 +218,7 @@ class TestCustomFieldsAndLimit:
         scraper.get_market_movers(market="stocks-usa", category="gainers", limit=10)
 
         call_kwargs = mock_req.call_args
-        payload = call_kwargs.kwargs.get("json_data") or call_kwargs[1].get("json_data")
+        payload = call_kwargs.kwargs["json_data"]
         assert payload["range"] == [0, 10]
 
 
@@ -248,7 +247,6 @@ class TestValidationErrors:
 
 
 class TestNetworkError:
-    @mock.patch("tv_scraper.core.base.make_request")
     def test_get_data_network_error(
         self, mock_req: mock.Mock, scraper: MarketMovers
     ) -> None:
@@ -266,7 +264,6 @@ class TestNetworkError:
 
 
 class TestResponseEnvelope:
-    @mock.patch("tv_scraper.core.base.make_request")
     def test_response_has_standard_envelope(
         self, mock_req: mock.Mock, scraper: MarketMovers
     ) -> None:
@@ -307,7 +304,6 @@ class TestCategoryDeterminesSort:
             ("after-hours-losers", "change", "asc"),
         ],
     )
-    @mock.patch("tv_scraper.core.base.make_request")
     def test_category_determines_sort(
         self,
         mock_req: mock.Mock,
@@ -328,6 +324,175 @@ class TestCategoryDeterminesSort:
         scraper.get_market_movers(market="stocks-usa", category=category)
 
         call_kwargs = mock_req.call_args
-        payload = call_kwargs.kwargs.get("json_data") or call_kwargs[1].get("json_data")
+        payload = call_kwargs.kwargs["json_data"]
         assert payload["sort"]["sortBy"] == expected_sort_by
         assert payload["sort"]["sortOrder"] == expected_order
+
+
+# ---------- Category determines filter ----------
+
+
+class TestCategoryDeterminesFilter:
+    @pytest.mark.parametrize(
+        "market,category,expected_filter",
+        [
+            (
+                "stocks-usa",
+                "penny-stocks",
+                [
+                    {"left": "market", "operation": "equal", "right": "america"},
+                    {"left": "close", "operation": "less", "right": 5},
+                ],
+            ),
+            (
+                "stocks-uk",
+                "pre-market-gainers",
+                [
+                    {"left": "market", "operation": "equal", "right": "uk"},
+                    {"left": "change", "operation": "greater", "right": 0},
+                ],
+            ),
+            (
+                "crypto",
+                "losers",
+                [{"left": "change", "operation": "less", "right": 0}],
+            ),
+            ("forex", "most-active", []),
+        ],
+    )
+    def test_category_determines_filter(
+        self,
+        scraper: MarketMovers,
+        market: str,
+        category: str,
+        expected_filter: list[dict[str, Any]],
+    ) -> None:
+        """Market and category map to the expected scanner filter conditions."""
+        payload = scraper._build_payload(
+            market, category, MarketMovers.DEFAULT_FIELDS, 10
+        )
+        assert payload["filter"] == expected_filter
+
+
+# ---------- Batch categories ----------
+
+
+class TestGetMarketMoversBatch:
+    def test_batch_returns_rows_per_category(
+        self, mock_req: mock.Mock, scraper: MarketMovers
+    ) -> None:
+        """Each requested category is fetched and keyed in ``data``."""
+        sort_to_symbol = {
+            ("change", "desc"): "NASDAQ:UP",
+            ("change", "asc"): "NASDAQ:DOWN",
+            ("volume", "desc"): "NASDAQ:BUSY",
+        }
+
+        def _respond(url: str, **kwargs: Any) -> FakeResponse:
+            sort = kwargs["json_data"]["sort"]
+            symbol = sort_to_symbol[(sort["sortBy"], sort["sortOrder"])]
+            return _mock_scanner_response([symbol], ["name"], [["Test"]])
+
+        mock_req.side_effect = _respond
+
+        result = scraper.get_market_movers_batch(
+            market="stocks-usa",
+            categories=["gainers", "losers", "most-active"],
+            fields=["name"],
+        )
+
+        assert result["status"] == "success"
+        assert {
+            category: [row["symbol"] for row in rows]
+            for category, rows in result["data"].items()
+        } == {
+            "gainers": ["NASDAQ:UP"],
+            "losers": ["NASDAQ:DOWN"],
+            "most-active": ["NASDAQ:BUSY"],
+        }
+        assert result["metadata"]["total"] == 3
+        assert mock_req.call_count == 3
+
+    def test_batch_rejects_invalid_category_before_requesting(
+        self, mock_req: mock.Mock, scraper: MarketMovers
+    ) -> None:
+        """An unsupported category fails the batch without any request."""
+        result = scraper.get_market_movers_batch(
+            market="crypto", categories=["gainers", "penny-stocks"]
+        )
+
+        assert result["status"] == "failed"
+        assert "Unsupported category" in result["error"]
+        mock_req.assert_not_called()
+
+    def test_batch_fails_when_a_category_fails(
+        self, mock_req: mock.Mock, scraper: MarketMovers
+    ) -> None:
+        """A network error in one category fails the whole batch."""
+        mock_req.side_effect = NetworkError("Connection refused")
+
+        result = scraper.get_market_movers_batch(categories=["gainers"])
+
+        assert result["status"] == "failed"
+        assert result["data"] is None
+        assert "gainers" in result["error"]
+        assert "Connection refused" in result["error"]
+
+    def test_batch_rejects_empty_categories(
+        self, mock_req: mock.Mock, scraper: MarketMovers
+    ) -> None:
+        """An empty list is an error rather than a request for the defaults."""
+        result = scraper.get_market_movers_batch(categories=[])
+
+        assert result["status"] == "failed"
+        assert result["error"] == "No categories requested."
+        mock_req.assert_not_called()
+
+    def test_batch_fetches_duplicate_categories_once(
+        self, mock_req: mock.Mock, scraper: MarketMovers
+    ) -> None:
+        """Repeated categories are requested once, keeping first-seen order."""
+        mock_req.return_value = _mock_scanner_response(["NASDAQ:A"], ["name"], [["A"]])
+
+        result = scraper.get_market_movers_batch(
+            categories=["losers", "gainers", "losers"], fields=["name"]
+        )
+
+        assert result["status"] == "success"
+        assert result["metadata"]["categories"] == ["losers", "gainers"]
+        assert list(result["data"]) == ["losers", "gainers"]
+        assert mock_req.call_count == 2
+
+    def test_batch_validates_each_category_once(
+        self, mock_req: mock.Mock, scraper: MarketMovers
+    ) -> None:
+        """Workers skip the per-call validation already done by the batch."""
+        mock_req.return_value = _mock_scanner_response(["NASDAQ:A"], ["name"], [["A"]])
+
+        with mock.patch.object(
+            scraper,
+            "_validate_market_category",
+            wraps=scraper._validate_market_category,
+        ) as validate:
+            scraper.get_market_movers_batch(categories=["gainers", "losers"])
+
+        assert validate.call_count == 2
+
+    def test_batch_exports_one_file(self, mock_req: mock.Mock) -> None:
+        """With export enabled, the batch writes a single file tagged by category."""
+        scraper = MarketMovers(export_result=True)
+        mock_req.return_value = _mock_scanner_response(["NASDAQ:A"], ["name"], [["A"]])
+
+        with mock.patch.object(scraper, "_export") as mock_export:
+            scraper.get_market_movers_batch(
+                categories=["gainers", "losers"], fields=["name"]
+            )
+
+        mock_export.assert_called_once_with(
+            data=[
+                {"category": "gainers", "symbol": "NASDAQ:A", "name": "A"},
+                {"category": "losers", "symbol": "NASDAQ:A", "name": "A"},
+            ],
+            symbol="stocks-usa_batch",
+            data_category="market_movers",
+        )
@@ -3,10 +3,10 @@
 from collections.abc import Iterator
 from typing import Any
 from unittest import mock
-from unittest.mock import MagicMock
 
 import pytest
 
+from tests.helpers import FakeResponse
 from tv_scraper.core.base import BaseScraper
 from tv_scraper.core.constants import STATUS_FAILED, STATUS_SUCCESS
 from tv_scraper.core.exceptions import NetworkError
@@ -19,14 +19,6 @@ def markets() -> Iterator[Markets]:
     yield Markets()
 
 
-def _mock_response(data: dict[str, Any]) -> MagicMock:
-    """Create a mock requests.Response with a .json() method."""
-    response = MagicMock()
-    response.json.return_value = data
-    response.status_code = 200
-    return response
-
-
 # ---------------------------------------------------------------------------
 # Sample API data
 # ---------------------------------------------------------------------------
@@ -82,7 +74,7 @@ class TestGetTopStocksSuccess:
 
     def test_get_data_success(self, markets: Markets) -> None:
         """Default params return success envelope with mapped data."""
-        mock_resp = _mock_response(SAMPLE_API_RESPONSE)
+        mock_resp = FakeResponse(SAMPLE_API_RESPONSE)
         with mock.patch.object(markets, "_make_request", return_value=mock_resp):
             result = markets.get_markets()
 
@@ -113,7 +105,7 @@ class TestGetTopStocksSuccess:
             ],
             "totalCount": 100,
         }
-        mock_resp = _mock_response(api_resp)
+        mock_resp = FakeResponse(api_resp)
 
         with mock.patch.object(
             markets, "_make_request", return_value=mock_resp
@@ -126,13 +118,13 @@ class TestGetTopStocksSuccess:
         assert result["data"][0]["volume"] == 8000000
 
         # Verify the request body used custom fields
-        call_kwargs = mock_req.call_args[1]
+        call_kwargs = mock_req.call_args.kwargs
         payload = call_kwargs["json_data"]
         assert payload["columns"] == custom_fields
 
     def test_get_data_custom_sort(self, markets: Markets) -> None:
         """sort_by parameter maps to the correct scanner sort field."""
-        mock_resp = _mock_response(SAMPLE_API_RESPONSE)
+        mock_resp = FakeResponse(SAMPLE_API_RESPONSE)
 
         with mock.patch.object(
             markets, "_make_request", return_value=mock_resp
@@ -140,13 +132,13 @@ class TestGetTopStocksSuccess:
             result = markets.get_markets(sort_by="volume")
 
         assert result["status"] == STATUS_SUCCESS
-        call_kwargs = mock_req.call_args[1]
+        call_kwargs = mock_req.call_args.kwargs
         payload = call_kwargs["json_data"]
         assert payload["sort"]["sortBy"] == "volume"
 
     def test_get_data_sort_order(self, markets: Markets) -> None:
         """sort_order parameter (asc/desc) is forwarded to API."""
-        mock_resp = _mock_response(SAMPLE_API_RESPONSE)
+        mock_resp = FakeResponse(SAMPLE_API_RESPONSE)
 
         with mock.patch.object(
             markets, "_make_request", return_value=mock_resp
@@ -154,13 +146,13 @@ class TestGetTopStocksSuccess:
             result = markets.get_markets(sort_order="asc")
 
         assert result["status"] == STATUS_SUCCESS
-        call_kwargs = mock_req.call_args[1]
+        call_kwargs = mock_req.call_args.kwargs
         payload = call_kwargs["json_data"]
         assert payload["sort"]["sortOrder"] == "asc"
 
     def test_get_data_with_limit(self, markets: Markets) -> None:
         """limit param is used in the range field of the payload."""
-        mock_resp = _mock_response(SAMPLE_API_RESPONSE)
+        mock_resp = FakeResponse(SAMPLE_API_RESPONSE)
 
         with mock.patch.object(
             markets, "_make_request", return_value=mock_resp
@@ -168,7 +160,7 @@ class TestGetTopStocksSuccess:
             result = markets.get_markets(limit=10)
 
         assert result["status"] == STATUS_SUCCESS
-        call_kwargs = mock_req.call_args[1]
+        call_kwargs = mock_req.call_args.kwargs
         payload = call_kwargs["json_data"]
         assert payload["range"] == [0, 10]
 
@@ -211,7 +203,7 @@ class TestResponseFormat:
 
     def test_response_has_standard_envelope(self, markets: Markets) -> None:
         """Success response contains exactly status/data/metadata/error keys."""
-        mock_resp = _mock_response(SAMPLE_API_RESPONSE)
+        mock_resp = FakeResponse(SAMPLE_API_RESPONSE)
         with mock.patch.object(markets, "_make_request", return_value=mock_resp):
             result = markets.get_markets()
 
@@ -228,7 +220,7 @@ class TestUsesMapScannerRows:
 
     def test_uses_map_scanner_rows(self, markets: Markets) -> None:
         """get_data must call _map_scanner_rows for data mapping."""
-        mock_resp = _mock_response(SAMPLE_API_RESPONSE)
+        mock_resp = FakeResponse(SAMPLE_API_RESPONSE)
         with (
             mock.patch.object(markets, "_make_request", return_value=mock_resp),
             mock.patch.object(
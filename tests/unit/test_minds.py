@@ -1,17 +1,18 @@
 """Tests for Minds scraper module."""
 
-from collections.abc import Iterator
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from tests.helpers import FakeResponse
 from tv_scraper.core.base import BaseScraper
 from tv_scraper.core.constants import STATUS_FAILED, STATUS_SUCCESS
 from tv_scraper.scrapers.social.minds import Minds
 
 
 def _sample_mind(
+    *,
     uid: str = "mind123",
     text: str = "AAPL looking bullish today",
     url: str = "https://www.tradingview.com/minds/mind123",
@@ -67,22 +68,18 @@ def _make_page_response(
     }
 
 
-def _mock_response(
-    json_data: dict[str, Any],
-    status_code: int = 200,
-) -> MagicMock:
-    """Create a mock requests.Response."""
-    resp = MagicMock()
-    resp.status_code = status_code
-    resp.text = str(json_data)
-    resp.json.return_value = json_data
-    return resp
+@pytest.fixture(autouse=True)
+def mock_get(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace ``BaseScraper._make_request`` with a mock for every test."""
+    mock = MagicMock()
+    monkeypatch.setattr(BaseScraper, "_make_request", mock)
+    return mock
 
 
-@pytest.fixture
-def minds() -> Iterator[Minds]:
-    """Create a Minds instance for testing."""
-    yield Minds()
+@pytest.fixture(scope="module")
+def minds() -> Minds:
+    """Create one Minds instance shared by every test in this module."""
+    return Minds()
 
 
 class TestInheritance:
@@ -96,10 +93,9 @@ class TestInheritance:
 class TestGetMindsSuccess:
     """Tests for successful minds retrieval."""
 
-    @patch("tv_scraper.core.base.BaseScraper._make_request")
     def test_get_data_success(self, mock_get: MagicMock, minds: Minds) -> None:
         """Single page success returns standard envelope with parsed data."""
-        mock_get.return_value = _mock_response(_make_page_response([_sample_mind()]))
+        mock_get.return_value = FakeResponse(_make_page_response([_sample_mind()]))
 
         result = minds.get_minds(exchange="NASDAQ", symbol="AAPL")
 
@@ -119,18 +115,16 @@ class TestGetMindsSuccess:
         assert "modified" not in mind
         assert "hidden" not in mind
 
-    @patch("tv_scraper.core.base.BaseScraper._make_request")
     def test_get_data_with_limit(self, mock_get: MagicMock, minds: Minds) -> None:
         """Limit parameter truncates results to at most that many items."""
         items = [_sample_mind(uid=f"m{i}") for i in range(5)]
-        mock_get.return_value = _mock_response(_make_page_response(items))
+        mock_get.return_value = FakeResponse(_make_page_response(items))
 
         result = minds.get_minds(exchange="NASDAQ", symbol="AAPL", limit=3)
 
         assert result["status"] == STATUS_SUCCESS
         assert len(result["data"]) == 3
 
-    @patch("tv_scraper.core.base.BaseScraper._make_request")
     def test_get_data_pagination(self, mock_get: MagicMock, minds: Minds) -> None:
         """Multi-page cursor-based pagination follows next URL."""
         page1 = _make_page_response(
@@ -143,8 +137,8 @@ class TestGetMindsSuccess:
         )
 
         mock_get.side_effect = [
-            _mock_response(page1),
-            _mock_response(page2),
+            FakeResponse(page1),
+            FakeResponse(page2),
         ]
 
         result = minds.get_minds(exchange="NASDAQ", symbol="AAPL")
@@ -154,10 +148,9 @@ class TestGetMindsSuccess:
         assert result["metadata"]["pages"] == 2
         assert mock_get.call_count == 2
 
-    @patch("tv_scraper.core.base.BaseScraper._make_request")
     def test_get_data_no_data(self, mock_get: MagicMock, minds: Minds) -> None:
         """Empty results returns success with empty list."""
-        mock_get.return_value = _mock_response(_make_page_response([]))
+        mock_get.return_value = FakeResponse(_make_page_response([]))
 
         result = minds.get_minds(exchange="NASDAQ", symbol="AAPL")
 
@@ -189,7 +182,6 @@ class TestGetMindsErrors:
         assert result["data"] is None
         assert result["error"] is not None
 
-    @patch("tv_scraper.core.base.BaseScraper._make_request")
     def test_get_data_network_error(self, mock_get: MagicMock, minds: Minds) -> None:
         """Network failure returns error response, does not raise."""
         mock_get.side_effect = Exception("Connection refused")
@@ -250,12 +242,11 @@ class TestParseMind:
 class TestResponseFormat:
     """Tests for response envelope structure."""
 
-    @patch("tv_scraper.core.base.BaseScraper._make_request")
     def test_response_has_standard_envelope(
         self, mock_get: MagicMock, minds: Minds
     ) -> None:
         """Response contains exactly status/data/metadata/error keys."""
-        mock_get.return_value = _mock_response(_make_page_response([_sample_mind()]))
+        mock_get.return_value = FakeResponse(_make_page_response([_sample_mind()]))
 
         result = minds.get_minds(exchange="NASDAQ", symbol="AAPL")
 
@@ -265,12 +256,11 @@ class TestResponseFormat:
         "tv_scraper.core.validators.DataValidator.verify_symbol_exchange",
         return_value=True,
     )
-    @patch("tv_scraper.core.base.BaseScraper._make_request")
     def test_separate_exchange_symbol_params(
-        self, mock_get: MagicMock, mock_verify: MagicMock, minds: Minds
+        self, mock_verify: MagicMock, mock_get: MagicMock, minds: Minds
     ) -> None:
         """Exchange and symbol are separate params, combined internally."""
-        mock_get.return_value = _mock_response(
+        mock_get.return_value = FakeResponse(
             _make_page_response(
                 [_sample_mind()],
                 symbol="NYSE:TSLA",
@@ -283,5 +273,5 @@ class TestResponseFormat:
 
         # Verify the API was called with the combined symbol
         call_kwargs = mock_get.call_args
-        params = call_kwargs.kwargs.get("params") or call_kwargs[1].get("params", {})
+        params = call_kwargs.kwargs["params"]
         assert params.get("symbol") == "NYSE:TSLA"
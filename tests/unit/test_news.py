@@ -1,11 +1,13 @@
 """Tests for News scraper module."""
 
-from collections.abc import Iterator
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
+from tests.helpers import FakeResponse
 from tv_scraper.core.base import BaseScraper
 from tv_scraper.core.constants import STATUS_FAILED, STATUS_SUCCESS
 from tv_scraper.scrapers.social.news import News
@@ -16,6 +18,7 @@ from tv_scraper.scrapers.social.news import News
 
 
 def _sample_headline(
+    *,
     headline_id: str = "h123",
     title: str = "Bitcoin Hits New High",
     short_description: str = "Bitcoin reached an all-time high today.",
@@ -37,21 +40,6 @@ def _sample_headline(
     }
 
 
-def _sample_cleaned_headline(
-    title: str = "Bitcoin Hits New High",
-    short_description: str = "Bitcoin reached an all-time high today.",
-    published: int = 1678900000,
-    story_path: str = "/news/story/h123",
-) -> dict[str, Any]:
-    """Build a cleaned headline (after filtering)."""
-    return {
-        "title": title,
-        "shortDescription": short_description,
-        "published": published,
-        "storyPath": story_path,
-    }
-
-
 def _make_headlines_response(
     items: list[dict[str, Any]] | None = None,
 ) -> dict[str, Any]:
@@ -61,21 +49,6 @@ def _make_headlines_response(
     return {"items": items}
 
 
-def _mock_response(
-    json_data: dict[str, Any] | None = None,
-    text: str = "",
-    status_code: int = 200,
-) -> MagicMock:
-    """Create a mock ``requests.Response``."""
-    resp = MagicMock()
-    resp.status_code = status_code
-    resp.text = text
-    if json_data is not None:
-        resp.json.return_value = json_data
-    resp.raise_for_status.return_value = None
-    return resp
-
-
 _STORY_JSON = {
     "title": "Bitcoin Hits New High",
     "short_description": "Bitcoin reached new highs today.",
@@ -109,46 +82,35 @@ _STORY_JSON = {
 }
 
 
-_ARTICLE_HTML = """
-<html>
-<body>
-<article>
-  <nav aria-label="Breadcrumbs">
-    <span class="breadcrumb-content-cZAS4vtj">Markets</span>
-    <span class="breadcrumb-content-cZAS4vtj">Crypto</span>
-  </nav>
-  <h1 class="title-KX2tCBZq">Bitcoin Hits New High</h1>
-  <time datetime="2025-01-15T10:00:00Z">Jan 15</time>
-  <div class="symbolsContainer-cBh_FN2P">
-    <a href="/symbols/BTCUSD">
-      <span class="description-cBh_FN2P">BTCUSD</span>
-      <img src="https://logo.com/btc.png" alt="BTC" />
-    </a>
-  </div>
-  <div class="body-KX2tCBZq">
-    <p>Bitcoin surged to a new all-time high today.</p>
-    <img src="https://img.com/chart.png" alt="Chart" />
-    <p>Market analysts are optimistic.</p>
-  </div>
-</article>
-<div class="rowTags-XYZ">
-  <span>Bitcoin</span>
-  <span>Crypto</span>
-</div>
-</body>
-</html>
-"""
-
-
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(autouse=True)
+def mock_get(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace ``BaseScraper._make_request`` with a mock for every test."""
+    mock = MagicMock()
+    monkeypatch.setattr(BaseScraper, "_make_request", mock)
+    return mock
+
+
+@pytest.fixture(scope="module")
+def news() -> News:
+    """Create one News instance shared by every test in this module."""
+    return News()
+
+
+@pytest.fixture(scope="session")
+def story_json_template() -> Mapping[str, Any]:
+    """Read-only view of the sample story payload."""
+    return MappingProxyType(_STORY_JSON)
+
+
 @pytest.fixture
-def news() -> Iterator[News]:
-    """Create a News instance for testing."""
-    yield News()
+def story_json(story_json_template: Mapping[str, Any]) -> dict[str, Any]:
+    """Shallow copy of the sample story payload that a test may modify."""
+    return {**story_json_template}
 
 
 # ---------------------------------------------------------------------------
@@ -172,11 +134,10 @@ class TestInheritance:
 class TestScrapeHeadlinesSuccess:
     """Tests for successful headline scraping."""
 
-    @patch("tv_scraper.core.base.BaseScraper._make_request")
     def test_scrape_headlines_success(self, mock_get: MagicMock, news: News) -> None:
         """Standard headline retrieval returns success envelope."""
-        mock_get.return_value = _mock_response(
-            json_data=_make_headlines_response([_sample_headline()]),
+        mock_get.return_value = FakeResponse(
+            payload=_make_headlines_response([_sample_headline()]),
         )
 
         result = news.get_news_headlines(exchange="BINANCE", symbol="BTCUSD")
@@ -200,76 +161,78 @@ class TestScrapeHeadlinesSuccess:
         assert "permission" not in item
         assert "sourceLogoid" not in item
 
-    @patch("tv_scraper.core.base.BaseScraper._make_request")
-    def test_scrape_headlines_with_provider(
-        self, mock_get: MagicMock, news: News
+    @pytest.mark.parametrize(
+        ("kwarg", "value", "expected"),
+        [
+            ("provider", "cointelegraph", "provider=cointelegraph"),
+            ("area", "americas", "area=AME"),
+            ("language", "fr", "lang=fr"),
+        ],
+    )
+    def test_scrape_headlines_filter_passthrough(
+        self,
+        mock_get: MagicMock,
+        news: News,
+        *,
+        kwarg: str,
+        value: str,
+        expected: str,
     ) -> None:
-        """Provider filter is passed through to the API URL."""
-        mock_get.return_value = _mock_response(
-            json_data=_make_headlines_response([_sample_headline()]),
-        )
-
-        result = news.get_news_headlines(
-            exchange="BINANCE",
-            symbol="BTCUSD",
-            provider="cointelegraph",
-        )
-
-        assert result["status"] == STATUS_SUCCESS
-        # Verify provider appears in the request URL
-        call_url = mock_get.call_args[0][0]
-        assert "provider=cointelegraph" in call_url
-
-    @patch("tv_scraper.core.base.BaseScraper._make_request")
-    def test_scrape_headlines_with_area(self, mock_get: MagicMock, news: News) -> None:
-        """Area filter is converted to area code and passed through."""
-        mock_get.return_value = _mock_response(
-            json_data=_make_headlines_response([_sample_headline()]),
+        """Each filter is converted if needed and passed through to the API URL."""
+        mock_get.return_value = FakeResponse(
+            payload=_make_headlines_response([_sample_headline()]),
         )
 
         result = news.get_news_headlines(
-            exchange="BINANCE",
-            symbol="BTCUSD",
-            area="americas",
+            exchange="BINANCE", symbol="BTCUSD", **{kwarg: value}
         )
 
         assert result["status"] == STATUS_SUCCESS
         call_url = mock_get.call_args[0][0]
-        assert "area=AME" in call_url
+        assert expected in call_url
 
-    @patch("tv_scraper.core.base.BaseScraper._make_request")
-    def test_scrape_headlines_with_language(
+    def test_scrape_headlines_empty_result(
         self, mock_get: MagicMock, news: News
     ) -> None:
-        """Language filter is passed through to the API URL."""
-        mock_get.return_value = _mock_response(
-            json_data=_make_headlines_response([_sample_headline()]),
+        """No headlines returns success with empty list."""
+        mock_get.return_value = FakeResponse(
+            payload=_make_headlines_response([]),
         )
 
-        result = news.get_news_headlines(
-            exchange="BINANCE",
-            symbol="BTCUSD",
-            language="fr",
-        )
+        result = news.get_news_headlines(exchange="BINANCE", symbol="BTCUSD")
 
         assert result["status"] == STATUS_SUCCESS
-        call_url = mock_get.call_args[0][0]
-        assert "lang=fr" in call_url
+        assert result["data"] == []
+        assert result["error"] is None
 
-    @patch("tv_scraper.core.base.BaseScraper._make_request")
-    def test_scrape_headlines_empty_result(
-        self, mock_get: MagicMock, news: News
+    @pytest.mark.parametrize(
+        ("sort_by", "expected_ids"),
+        [
+            ("latest", ["b", "c", "a"]),
+            ("oldest", ["a", "c", "b"]),
+            ("most_urgent", ["a", "c", "b"]),
+            ("least_urgent", ["b", "c", "a"]),
+        ],
+    )
+    def test_scrape_headlines_sort_option(
+        self, mock_get: MagicMock, news: News, sort_by: str, expected_ids: list[str]
     ) -> None:
-        """No headlines returns success with empty list."""
-        mock_get.return_value = _mock_response(
-            json_data=_make_headlines_response([]),
+        """Each sort option orders headlines client-side."""
+        headlines = [
+            {**_sample_headline(headline_id="a", published=100), "urgency": 3},
+            {**_sample_headline(headline_id="b", published=300), "urgency": 1},
+            {**_sample_headline(headline_id="c", published=200), "urgency": 2},
+        ]
+        mock_get.return_value = FakeResponse(
+            payload=_make_headlines_response(headlines),
         )
 
-        result = news.get_news_headlines(exchange="BINANCE", symbol="BTCUSD")
+        result = news.get_news_headlines(
+            exchange="BINANCE", symbol="BTCUSD", sort_by=sort_by
+        )
 
         assert result["status"] == STATUS_SUCCESS
-        assert result["data"] == []
-        assert result["error"] is None
+        assert [item["id"] for item in result["data"]] == expected_ids
 
 
 # ---------------------------------------------------------------------------
@@ -280,51 +243,35 @@ class TestScrapeHeadlinesSuccess:
 class TestScrapeHeadlinesValidation:
     """Validation failures return error responses — never raise."""
 
-    def test_scrape_headlines_invalid_exchange(self, news: News) -> None:
-        """Invalid exchange returns error response."""
-        result = news.get_news_headlines(exchange="FAKEXCHANGE", symbol="BTCUSD")
-
-        assert result["status"] == STATUS_FAILED
-        assert result["data"] is None
-        assert result["error"] is not None
-        assert (
-            "exchange" in result["error"].lower()
-            or "invalid" in result["error"].lower()
-        )
-
-    def test_scrape_headlines_empty_symbol(self, news: News) -> None:
-        """Empty symbol returns error response."""
-        result = news.get_news_headlines(exchange="BINANCE", symbol="")
-
-        assert result["status"] == STATUS_FAILED
-        assert result["data"] is None
-        assert result["error"] is not None
-
-    def test_scrape_headlines_invalid_sort(self, news: News) -> None:
-        """Invalid sort_by value returns error response."""
-        result = news.get_news_headlines(
-            exchange="BINANCE",
-            symbol="BTCUSD",
-            sort_by="invalid_sort",
-        )
-
-        assert result["status"] == STATUS_FAILED
-        assert result["data"] is None
-        assert "sort" in result["error"].lower() or "invalid" in result["error"].lower()
-
-    def test_scrape_headlines_invalid_section(self, news: News) -> None:
-        """Invalid section value returns error response."""
-        result = news.get_news_headlines(
-            exchange="BINANCE",
-            symbol="BTCUSD",
-            section="invalid_section",
-        )
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            ({"exchange": "FAKEXCHANGE", "symbol": "BTCUSD"}, "exchange"),
+            ({"exchange": "BINANCE", "symbol": ""}, "symbol"),
+            (
+                {"exchange": "BINANCE", "symbol": "BTCUSD", "sort_by": "invalid_sort"},
+                "sort",
+            ),
+            (
+                {
+                    "exchange": "BINANCE",
+                    "symbol": "BTCUSD",
+                    "section": "invalid_section",
+                },
+                "section",
+            ),
+        ],
+        ids=["invalid_exchange", "empty_symbol", "invalid_sort", "invalid_section"],
+    )
+    def test_scrape_headlines_invalid_input(
+        self, news: News, *, kwargs: dict[str, str], expected: str
+    ) -> None:
+        """Invalid input returns an error response naming the bad argument."""
+        result = news.get_news_headlines(**kwargs)
 
         assert result["status"] == STATUS_FAILED
         assert result["data"] is None
-        assert (
-            "section" in result["error"].lower() or "invalid" in result["error"].lower()
-        )
+        assert expected in result["error"].lower()
 
 
 # ---------------------------------------------------------------------------
@@ -335,7 +282,6 @@ class TestScrapeHeadlinesValidation:
 class TestScrapeHeadlinesErrors:
     """Runtime errors return error responses."""
 
-    @patch("tv_scraper.core.base.BaseScraper._make_request")
     def test_scrape_headlines_network_error(
         self, mock_get: MagicMock, news: News
     ) -> None:
@@ -348,10 +294,9 @@ class TestScrapeHeadlinesErrors:
         assert result["data"] is None
         assert result["error"] is not None
 
-    @patch("tv_scraper.core.base.BaseScraper._make_request")
     def test_scrape_headlines_captcha(self, mock_get: MagicMock, news: News) -> None:
         """Captcha challenge returns error response."""
-        mock_get.return_value = _mock_response(
+        mock_get.return_value = FakeResponse(
             text="<title>Captcha Challenge</title>",
         )
 
@@ -370,10 +315,14 @@ class TestScrapeHeadlinesErrors:
 class TestScrapeContentSuccess:
     """Tests for article content scraping using JSON API."""
 
-    @patch("tv_scraper.core.base.BaseScraper._make_request")
-    def test_scrape_content_success(self, mock_get: MagicMock, news: News) -> None:
+    def test_scrape_content_success(
+        self,
+        mock_get: MagicMock,
+        news: News,
+        story_json_template: Mapping[str, Any],
+    ) -> None:
         """Successfully parse article JSON into structured content."""
-        mock_get.return_value = _mock_response(json_data=_STORY_JSON)
+        mock_get.return_value = FakeResponse(payload=story_json_template)
 
         result = news.get_news_content(
             story_id="tag:reuters.com,2026:newsml_L4N3Z9104:0"
@@ -395,15 +344,22 @@ class TestScrapeContentSuccess:
         # Paragraphs should be separated by newlines
         assert "\n" in description
 
-    @patch("tv_scraper.core.base.BaseScraper._make_request")
-    def test_scrape_content_story_path_without_slash(
-        self, mock_get: MagicMock, news: News
+    @pytest.mark.parametrize(
+        "story_path",
+        ["/news/story/h123", "news/story/h123"],
+        ids=["leading_slash", "without_slash"],
+    )
+    def test_scrape_content_story_path(
+        self,
+        mock_get: MagicMock,
+        news: News,
+        story_json: dict[str, Any],
+        story_path: str,
     ) -> None:
-        """Story path without leading slash should be fixed."""
-        story_json = _STORY_JSON.copy()
-        story_json["story_path"] = "news/story/h123"  # No leading slash
+        """Story path is returned with exactly one leading slash."""
+        story_json["story_path"] = story_path
 
-        mock_get.return_value = _mock_response(json_data=story_json)
+        mock_get.return_value = FakeResponse(payload=story_json)
 
         result = news.get_news_content(
             story_id="tag:reuters.com,2026:newsml_L4N3Z9104:0"
@@ -421,7 +377,6 @@ class TestScrapeContentSuccess:
 class TestScrapeContentErrors:
     """Error handling for content scraping."""
 
-    @patch("tv_scraper.core.base.BaseScraper._make_request")
     def test_scrape_content_network_error(
         self, mock_get: MagicMock, news: News
     ) -> None:
@@ -445,13 +400,12 @@ class TestScrapeContentErrors:
 class TestResponseFormat:
     """Verify the standardized response envelope."""
 
-    @patch("tv_scraper.core.base.BaseScraper._make_request")
     def test_response_has_standard_envelope(
         self, mock_get: MagicMock, news: News
     ) -> None:
         """Response contains exactly status/data/metadata/error keys."""
-        mock_get.return_value = _mock_response(
-            json_data=_make_headlines_response([_sample_headline()]),
+        mock_get.return_value = FakeResponse(
+            payload=_make_headlines_response([_sample_headline()]),
         )
 
         result = news.get_news_headlines(exchange="BINANCE", symbol="BTCUSD")
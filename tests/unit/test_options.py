@@ -1,30 +1,21 @@
 """Tests for Options scraper module."""
 
-from collections.abc import Iterator
-from typing import Any
 from unittest import mock
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
+from tests.helpers import FakeResponse
 from tv_scraper.core.base import BaseScraper
 from tv_scraper.core.constants import STATUS_FAILED, STATUS_SUCCESS
 from tv_scraper.core.exceptions import NetworkError
 from tv_scraper.scrapers.market_data.options import Options
 
 
-@pytest.fixture
-def options() -> Iterator[Options]:
-    """Create an Options instance for testing."""
-    yield Options()
-
-
-def _mock_response(data: dict[str, Any]) -> MagicMock:
-    """Create a mock requests.Response with a .json() method."""
-    response = MagicMock()
-    response.json.return_value = data
-    response.status_code = 200
-    return response
+@pytest.fixture(scope="module")
+def options() -> Options:
+    """Create one Options instance shared by every test in this module."""
+    return Options()
 
 
 class TestInheritance:
@@ -49,7 +40,7 @@ class TestGetOptionsChainSuccess:
             "fields": ["strike", "bid", "ask"],
             "symbols": [{"s": "BSE:BSX260219C83300", "f": [83300, 250.05, 251.5]}],
         }
-        mock_resp = _mock_response(mock_data)
+        mock_resp = FakeResponse(mock_data)
 
         with mock.patch.object(options, "_make_request", return_value=mock_resp):
             result = options.get_options_by_expiry(
@@ -77,7 +68,7 @@ class TestGetOptionsChainSuccess:
             "fields": ["expiration", "bid", "ask"],
             "symbols": [{"s": "BSE:BSX260219C83300", "f": [20260219, 250.05, 251.5]}],
         }
-        mock_resp = _mock_response(mock_data)
+        mock_resp = FakeResponse(mock_data)
 
         with mock.patch.object(options, "_make_request", return_value=mock_resp):
             result = options.get_options_by_strike(
@@ -126,8 +117,7 @@ class TestGetOptionsChainErrors:
 
     def test_404_handling(self, options: Options) -> None:
         """HTTP 404 returns a specific 'not found' error response."""
-        mock_resp = MagicMock()
-        mock_resp.status_code = 404
+        mock_resp = FakeResponse(status_code=404)
 
         with mock.patch.object(options, "_make_request", return_value=mock_resp):
             result = options.get_options_by_strike(
@@ -1,29 +1,22 @@
 """Tests for Overview scraper module."""
 
-from collections.abc import Iterator
+import math
+from typing import Any
 from unittest import mock
-from unittest.mock import MagicMock
 
 import pytest
 
+from tests.helpers import FakeResponse
 from tv_scraper.core.base import BaseScraper
 from tv_scraper.core.constants import STATUS_FAILED, STATUS_SUCCESS
 from tv_scraper.core.exceptions import NetworkError
 from tv_scraper.scrapers.market_data.overview import Overview
 
 
-@pytest.fixture
-def overview() -> Iterator[Overview]:
-    """Create an Overview instance for testing."""
-    yield Overview()
-
-
-def _mock_response(data: dict) -> MagicMock:
-    """Create a mock requests.Response with a .json() method."""
-    response = MagicMock()
-    response.json.return_value = data
-    response.status_code = 200
-    return response
+@pytest.fixture(scope="module")
+def overview() -> Overview:
+    """Create one Overview instance shared by every test in this module."""
+    return Overview()
 
 
 class TestOverviewInheritance:
@@ -45,7 +38,7 @@ class TestGetOverviewSuccess:
             "close": 150.25,
             "market_cap_basic": 2500000000000,
         }
-        mock_resp = _mock_response(mock_data)
+        mock_resp = FakeResponse(mock_data)
 
         with mock.patch.object(overview, "_make_request", return_value=mock_resp):
             result = overview.get_overview(exchange="NASDAQ", symbol="AAPL")
@@ -57,6 +50,18 @@ class TestGetOverviewSuccess:
         assert result["data"]["name"] == "AAPL"
         assert result["data"]["close"] == 150.25
 
+    def test_get_data_with_nan_value(self, overview: Overview) -> None:
+        """A NaN field in the body still decodes to a success envelope."""
+        mock_resp = FakeResponse({"close": float("nan")})
+
+        with mock.patch.object(overview, "_make_request", return_value=mock_resp):
+            result = overview.get_overview(
+                exchange="NASDAQ", symbol="AAPL", fields=["close"]
+            )
+
+        assert result["status"] == STATUS_SUCCESS
+        assert math.isnan(result["data"]["close"])
+
     def test_get_data_with_custom_fields(self, overview: Overview) -> None:
         """Custom fields are sent to the API and returned correctly."""
         custom_fields = ["close", "volume", "market_cap_basic"]
@@ -65,7 +70,7 @@ class TestGetOverviewSuccess:
             "volume": 1000000,
             "market_cap_basic": 2500000000000,
         }
-        mock_resp = _mock_response(mock_data)
+        mock_resp = FakeResponse(mock_data)
 
         with mock.patch.object(
             overview, "_make_request", return_value=mock_resp
@@ -116,80 +121,46 @@ class TestGetOverviewErrors:
         assert "Connection refused" in result["error"]
 
 
-class TestCategoryMethods:
-    """Tests for convenience category methods."""
-
-    def test_get_profile_returns_profile_fields(self, overview: Overview) -> None:
-        """get_profile passes BASIC_FIELDS to get_data."""
-        with mock.patch.object(overview, "get_overview") as mock_get:
-            mock_get.return_value = overview._success_response(
-                {"name": "AAPL"}, exchange="NASDAQ", symbol="AAPL"
-            )
-            result = overview.get_profile(exchange="NASDAQ", symbol="AAPL")
-
-        mock_get.assert_called_once_with(
-            exchange="NASDAQ", symbol="AAPL", fields=Overview.BASIC_FIELDS
-        )
-        assert result["status"] == STATUS_SUCCESS
-
-    def test_get_statistics_returns_stats_fields(self, overview: Overview) -> None:
-        """get_statistics passes correct combined fields."""
-        expected_fields = (
-            Overview.MARKET_FIELDS
-            + Overview.VALUATION_FIELDS
-            + Overview.DIVIDEND_FIELDS
-        )
-        with mock.patch.object(overview, "get_overview") as mock_get:
-            mock_get.return_value = overview._success_response(
-                {"market_cap_basic": 2500000000000},
-                exchange="NASDAQ",
-                symbol="AAPL",
-            )
-            result = overview.get_statistics(exchange="NASDAQ", symbol="AAPL")
-
-        mock_get.assert_called_once_with(
-            exchange="NASDAQ", symbol="AAPL", fields=expected_fields
-        )
-        assert result["status"] == STATUS_SUCCESS
+# (method, fields passed to get_overview, sample data returned)
+CATEGORY_CASES: list[tuple[str, list[str], dict[str, Any]]] = [
+    ("get_profile", Overview.BASIC_FIELDS, {"name": "AAPL"}),
+    (
+        "get_statistics",
+        Overview.MARKET_FIELDS + Overview.VALUATION_FIELDS + Overview.DIVIDEND_FIELDS,
+        {"market_cap_basic": 2500000000000},
+    ),
+    ("get_financials", Overview.FINANCIAL_FIELDS, {"total_revenue": 400000000000}),
+    ("get_performance", Overview.PERFORMANCE_FIELDS, {"Perf.W": 1.5}),
+    (
+        "get_technicals",
+        Overview.TECHNICAL_FIELDS + Overview.VOLATILITY_FIELDS,
+        {"RSI": 55.0},
+    ),
+]
 
-    def test_get_financials_returns_financial_fields(self, overview: Overview) -> None:
-        """get_financials passes FINANCIAL_FIELDS."""
-        with mock.patch.object(overview, "get_overview") as mock_get:
-            mock_get.return_value = overview._success_response(
-                {"total_revenue": 400000000000},
-                exchange="NASDAQ",
-                symbol="AAPL",
-            )
-            result = overview.get_financials(exchange="NASDAQ", symbol="AAPL")
 
-        mock_get.assert_called_once_with(
-            exchange="NASDAQ", symbol="AAPL", fields=Overview.FINANCIAL_FIELDS
-        )
-        assert result["status"] == STATUS_SUCCESS
+class TestCategoryMethods:
+    """Tests for convenience category methods."""
 
-    def test_get_performance_returns_performance_fields(
-        self, overview: Overview
+    @pytest.mark.parametrize(
+        ("method", "expected_fields", "payload"),
+        CATEGORY_CASES,
+        ids=[case[0] for case in CATEGORY_CASES],
+    )
+    def test_category_delegates_to_get_overview(
+        self,
+        overview: Overview,
+        *,
+        method: str,
+        expected_fields: list[str],
+        payload: dict[str, Any],
     ) -> None:
-        """get_performance passes PERFORMANCE_FIELDS."""
-        with mock.patch.object(overview, "get_overview") as mock_get:
-            mock_get.return_value = overview._success_response(
-                {"Perf.W": 1.5}, exchange="NASDAQ", symbol="AAPL"
-            )
-            result = overview.get_performance(exchange="NASDAQ", symbol="AAPL")
-
-        mock_get.assert_called_once_with(
-            exchange="NASDAQ", symbol="AAPL", fields=Overview.PERFORMANCE_FIELDS
-        )
-        assert result["status"] == STATUS_SUCCESS
-
-    def test_get_technicals_returns_technical_fields(self, overview: Overview) -> None:
-        """get_technicals passes TECHNICAL_FIELDS + VOLATILITY_FIELDS."""
-        expected_fields = Overview.TECHNICAL_FIELDS + Overview.VOLATILITY_FIELDS
+        """Each category method calls get_overview with its field group."""
         with mock.patch.object(overview, "get_overview") as mock_get:
             mock_get.return_value = overview._success_response(
-                {"RSI": 55.0}, exchange="NASDAQ", symbol="AAPL"
+                payload, exchange="NASDAQ", symbol="AAPL"
             )
-            result = overview.get_technicals(exchange="NASDAQ", symbol="AAPL")
+            result = getattr(overview, method)(exchange="NASDAQ", symbol="AAPL")
 
         mock_get.assert_called_once_with(
             exchange="NASDAQ", symbol="AAPL", fields=expected_fields
@@ -203,7 +174,7 @@ class TestResponseFormat:
     def test_response_has_standard_envelope(self, overview: Overview) -> None:
         """Response contains exactly status/data/metadata/error keys."""
         mock_data = {"close": 150.25}
-        mock_resp = _mock_response(mock_data)
+        mock_resp = FakeResponse(mock_data)
         with mock.patch.object(overview, "_make_request", return_value=mock_resp):
             result = overview.get_overview(
                 exchange="NASDAQ", symbol="AAPL", fields=["close"]
@@ -215,7 +186,7 @@ class TestResponseFormat:
     def test_combines_exchange_symbol_for_api(self, overview: Overview) -> None:
         """Verify EXCHANGE:SYMBOL is combined internally for the API call."""
         mock_data = {"close": 150.25}
-        mock_resp = _mock_response(mock_data)
+        mock_resp = FakeResponse(mock_data)
         with mock.patch.object(
             overview, "_make_request", return_value=mock_resp
         ) as mock_req:
@@ -1,29 +1,20 @@
 """Tests for Screener scraper module."""
 
-from collections.abc import Iterator
 from unittest import mock
-from unittest.mock import MagicMock
 
 import pytest
 
+from tests.helpers import FakeResponse
 from tv_scraper.core.base import BaseScraper
 from tv_scraper.core.constants import STATUS_FAILED, STATUS_SUCCESS
 from tv_scraper.core.exceptions import NetworkError
 from tv_scraper.scrapers.screening.screener import Screener
 
 
-@pytest.fixture
-def screener() -> Iterator[Screener]:
-    """Create a Screener instance for testing."""
-    yield Screener()
-
-
-def _mock_response(data: dict) -> MagicMock:
-    """Create a mock requests.Response with a .json() method."""
-    response = MagicMock()
-    response.json.return_value = data
-    response.status_code = 200
-    return response
+@pytest.fixture(scope="module")
+def screener() -> Screener:
+    """Create one Screener instance shared by every test in this module."""
+    return Screener()
 
 
 class TestScreenerInheritance:
@@ -39,7 +30,7 @@ class TestScreenSuccess:
 
     def test_get_data_success(self, screener: Screener) -> None:
         """Default params return success envelope with data list."""
-        mock_resp = _mock_response(
+        mock_resp = FakeResponse(
             {
                 "data": [
                     {
@@ -87,7 +78,7 @@ class TestScreenSuccess:
     def test_get_data_custom_fields(self, screener: Screener) -> None:
         """Custom fields list is used instead of defaults."""
         custom_fields = ["name", "close", "volume"]
-        mock_resp = _mock_response(
+        mock_resp = FakeResponse(
             {
                 "data": [
                     {"s": "NASDAQ:AAPL", "d": ["Apple Inc.", 150.0, 50000000]},
@@ -118,7 +109,7 @@ class TestScreenSuccess:
             {"left": "close", "operation": "greater", "right": 100},
             {"left": "volume", "operation": "greater", "right": 1000000},
         ]
-        mock_resp = _mock_response(
+        mock_resp = FakeResponse(
             {
                 "data": [
                     {
@@ -151,7 +142,7 @@ class TestScreenSuccess:
 
     def test_get_data_with_sort(self, screener: Screener) -> None:
         """sort_by and sort_order are included in the API payload."""
-        mock_resp = _mock_response(
+        mock_resp = FakeResponse(
             {
                 "data": [
                     {
@@ -187,7 +178,7 @@ class TestScreenSuccess:
 
     def test_get_data_with_limit(self, screener: Screener) -> None:
         """Limit param controls the range in the API payload."""
-        mock_resp = _mock_response(
+        mock_resp = FakeResponse(
             {
                 "data": [
                     {
@@ -248,7 +239,7 @@ class TestResponseFormat:
 
     def test_response_has_standard_envelope(self, screener: Screener) -> None:
         """Success response contains exactly status/data/metadata/error keys."""
-        mock_resp = _mock_response(
+        mock_resp = FakeResponse(
             {
                 "data": [
                     {
@@ -294,7 +285,7 @@ class TestUsesMapScannerRows:
         raw_items = [
             {"s": "NASDAQ:AAPL", "d": ["Apple", 150.0]},
         ]
-        mock_resp = _mock_response(
+        mock_resp = FakeResponse(
             {
                 "data": raw_items,
                 "totalCount": 1,
@@ -320,7 +311,7 @@ class TestDefaultFields:
 
     def test_crypto_default_fields(self, screener: Screener) -> None:
         """Crypto market uses crypto-specific default fields."""
-        mock_resp = _mock_response(
+        mock_resp = FakeResponse(
             {
                 "data": [
                     {
@@ -351,7 +342,7 @@ class TestDefaultFields:
 
     def test_forex_default_fields(self, screener: Screener) -> None:
         """Forex market uses forex-specific default fields."""
-        mock_resp = _mock_response(
+        mock_resp = FakeResponse(
             {
                 "data": [
                     {"s": "FX:EURUSD", "d": ["EUR/USD", 1.10, 0.5, 0.005, 0.7]},
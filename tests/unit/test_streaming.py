@@ -353,6 +353,37 @@ class TestStreamer:
             s.get_candles(exchange="BINANCE", symbol="BTCUSDT", numb_candles=1)
             assert mock_save.called
 
+    @patch(
+        "tv_scraper.core.validators.DataValidator.verify_symbol_exchange",
+        return_value=True,
+    )
+    @patch("tv_scraper.streaming.stream_handler.create_connection")
+    def test_get_candles_export_writes_json(
+        self, mock_cc, mock_validate, tmp_path, monkeypatch
+    ):
+        """export_result=True writes the candles to export/ under the cwd."""
+        monkeypatch.chdir(tmp_path)
+        mock_ws = MagicMock()
+        mock_cc.return_value = mock_ws
+
+        ohlcv_entry = {"i": 0, "v": [1700000000, 100.0, 105.0, 99.0, 102.0, 5000]}
+        ts_pkt = {
+            "m": "timescale_update",
+            "p": ["cs_test", {"sds_1": {"s": [ohlcv_entry]}}],
+        }
+        ts_raw = json.dumps(ts_pkt)
+        framed = f"~m~{len(ts_raw)}~m~{ts_raw}"
+        mock_ws.recv.side_effect = [framed, ConnectionError("done")]
+
+        from tv_scraper.streaming.streamer import Streamer
+
+        s = Streamer(export_result=True, export_type="json")
+        result = s.get_candles(exchange="BINANCE", symbol="BTCUSDT", numb_candles=1)
+
+        exported = list((tmp_path / "export").glob("ohlcv_btcusdt_*.json"))
+        assert len(exported) == 1
+        assert json.loads(exported[0].read_text()) == result["data"]["ohlcv"]
+
     @patch(
         "tv_scraper.core.validators.DataValidator.verify_symbol_exchange",
         return_value=True,
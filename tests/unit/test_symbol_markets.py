@@ -2,10 +2,10 @@
 
 from collections.abc import Iterator
 from unittest import mock
-from unittest.mock import MagicMock
 
 import pytest
 
+from tests.helpers import FakeResponse
 from tv_scraper.core.base import BaseScraper
 from tv_scraper.core.constants import STATUS_FAILED, STATUS_SUCCESS
 from tv_scraper.core.exceptions import NetworkError
@@ -18,14 +18,6 @@ def symbol_markets() -> Iterator[SymbolMarkets]:
     yield SymbolMarkets()
 
 
-def _mock_response(data: dict) -> MagicMock:
-    """Create a mock requests.Response with a .json() method."""
-    response = MagicMock()
-    response.json.return_value = data
-    response.status_code = 200
-    return response
-
-
 class TestInheritance:
     """Verify SymbolMarkets inherits from BaseScraper."""
 
@@ -39,7 +31,7 @@ class TestScrapeSuccess:
 
     def test_get_data_success(self, symbol_markets: SymbolMarkets) -> None:
         """Default params return success envelope with data list."""
-        mock_resp = _mock_response(
+        mock_resp = FakeResponse(
             {
                 "data": [
                     {
@@ -90,7 +82,7 @@ class TestScrapeSuccess:
     def test_get_data_custom_fields(self, symbol_markets: SymbolMarkets) -> None:
         """Custom fields list is used instead of defaults."""
         custom_fields = ["name", "close", "volume", "exchange"]
-        mock_resp = _mock_response(
+        mock_resp = FakeResponse(
             {
                 "data": [
                     {"s": "NASDAQ:AAPL", "d": ["AAPL", 150.0, 50000000, "NASDAQ"]},
@@ -118,7 +110,7 @@ class TestScrapeSuccess:
 
     def test_get_data_custom_scanner(self, symbol_markets: SymbolMarkets) -> None:
         """Custom scanner is used in the URL."""
-        mock_resp = _mock_response(
+        mock_resp = FakeResponse(
             {
                 "data": [
                     {
@@ -155,7 +147,7 @@ class TestScrapeSuccess:
 
     def test_get_data_with_limit(self, symbol_markets: SymbolMarkets) -> None:
         """Limit param controls the range in the API payload."""
-        mock_resp = _mock_response(
+        mock_resp = FakeResponse(
             {
                 "data": [
                     {
@@ -230,7 +222,7 @@ class TestResponseFormat:
         self, symbol_markets: SymbolMarkets
     ) -> None:
         """Success response contains exactly status/data/metadata/error keys."""
-        mock_resp = _mock_response(
+        mock_resp = FakeResponse(
             {
                 "data": [
                     {
@@ -293,7 +285,7 @@ class TestUsesMapScannerRows:
                 ],
             },
         ]
-        mock_resp = _mock_response(
+        mock_resp = FakeResponse(
             {
                 "data": raw_items,
                 "totalCount": 1,
@@ -1,10 +1,10 @@
 """Tests for Technicals scraper module."""
 
 from unittest import mock
-from unittest.mock import MagicMock
 
 import pytest
 
+from tests.helpers import FakeResponse
 from tv_scraper.core.base import BaseScraper
 from tv_scraper.core.constants import STATUS_FAILED, STATUS_SUCCESS
 from tv_scraper.core.exceptions import NetworkError
@@ -17,14 +17,6 @@ def technicals() -> Technicals:
     return Technicals()
 
 
-def _mock_response(data: dict) -> MagicMock:
-    """Create a mock requests.Response with a .json() method."""
-    response = MagicMock()
-    response.json.return_value = data
-    response.status_code = 200
-    return response
-
-
 class TestTechnicalsInheritance:
     """Verify Technicals inherits from BaseScraper."""
 
@@ -38,7 +30,7 @@ class TestScrapeSuccess:
 
     def test_get_data_success_default_indicators(self, technicals: Technicals) -> None:
         """Scrape with a few indicators and verify envelope format."""
-        mock_resp = _mock_response({"RSI": 55.0, "Recommend.All": 0.7, "CCI20": 45.0})
+        mock_resp = FakeResponse({"RSI": 55.0, "Recommend.All": 0.7, "CCI20": 45.0})
         with mock.patch.object(technicals, "_make_request", return_value=mock_resp):
             result = technicals.get_technicals(
                 exchange="BITSTAMP",
@@ -54,7 +46,7 @@ class TestScrapeSuccess:
 
     def test_get_data_success_specific_indicators(self, technicals: Technicals) -> None:
         """Scrape with specific indicators returns correct mapped data."""
-        mock_resp = _mock_response({"RSI": 50.0, "Stoch.K": 80.0})
+        mock_resp = FakeResponse({"RSI": 50.0, "Stoch.K": 80.0})
         with mock.patch.object(technicals, "_make_request", return_value=mock_resp):
             result = technicals.get_technicals(
                 exchange="BINANCE",
@@ -71,7 +63,7 @@ class TestScrapeSuccess:
         """all_indicators=True loads every indicator from the data file."""
         all_inds = technicals.validator.get_indicators()
         mock_data = {ind: float(i) for i, ind in enumerate(all_inds)}
-        mock_resp = _mock_response(mock_data)
+        mock_resp = FakeResponse(mock_data)
         with mock.patch.object(technicals, "_make_request", return_value=mock_resp):
             result = technicals.get_technicals(
                 exchange="BINANCE",
@@ -84,7 +76,7 @@ class TestScrapeSuccess:
 
     def test_get_data_with_timeframe(self, technicals: Technicals) -> None:
         """Non-daily timeframe appends |{value} suffix to indicator names."""
-        mock_resp = _mock_response({"RSI|240": 60.0})
+        mock_resp = FakeResponse({"RSI|240": 60.0})
         with mock.patch.object(
             technicals, "_make_request", return_value=mock_resp
         ) as mock_req:
@@ -189,7 +181,7 @@ class TestResponseFormat:
 
     def test_response_has_standard_envelope(self, technicals: Technicals) -> None:
         """Success response contains exactly status/data/metadata/error keys."""
-        mock_resp = _mock_response({"data": [{"s": "BINANCE:BTCUSD", "d": [50.0]}]})
+        mock_resp = FakeResponse({"data": [{"s": "BINANCE:BTCUSD", "d": [50.0]}]})
         with mock.patch.object(technicals, "_make_request", return_value=mock_resp):
             result = technicals.get_technicals(
                 exchange="BINANCE",
@@ -1,6 +1,9 @@
 """Base scraper class for tv_scraper."""
 
+import functools
+import http.cookiejar
 import logging
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -9,11 +12,22 @@ if TYPE_CHECKING:
 from tv_scraper.core.constants import DEFAULT_TIMEOUT, STATUS_FAILED, STATUS_SUCCESS
 from tv_scraper.core.validators import DataValidator
 from tv_scraper.utils.helpers import generate_user_agent
-from tv_scraper.utils.http import make_request
+from tv_scraper.utils.http import make_request, parse_json
 from tv_scraper.utils.io import generate_export_filepath, save_csv_file, save_json_file
 
 logger = logging.getLogger(__name__)
 
+_CAPTCHA_MARKER_BYTES = b"<title>Captcha Challenge</title>"
+
+
+@functools.lru_cache(maxsize=32)
+def _row_template(fields: tuple[str, ...]) -> dict[str, None]:
+    """Return a cached ``{field: None}`` template for scanner row mapping.
+
+    Callers must copy the template rather than mutate it.
+    """
+    return dict.fromkeys(fields)
+
 
 class BaseScraper:
     """Base class for all scrapers providing common functionality.
@@ -45,6 +59,7 @@ class BaseScraper:
         self.timeout = timeout
         self.validator = DataValidator()
         self._headers: dict[str, str] = {"User-Agent": generate_user_agent()}
+        self._idle_sessions: list[requests.Session] = []
 
     def _success_response(self, data: Any, **metadata: Any) -> dict[str, Any]:
         """Build a standardized success response.
@@ -100,11 +115,85 @@ class BaseScraper:
         kwargs.setdefault("headers", self._headers)
         kwargs.setdefault("timeout", self.timeout)
 
-        return make_request(
-            url,
-            method=method,
-            **kwargs,
-        )
+        if kwargs.get("session") is not None:
+            return make_request(url, method=method, **kwargs)
+
+        session = self._acquire_session()
+        try:
+            return make_request(url, method=method, session=session, **kwargs)
+        finally:
+            self._idle_sessions.append(session)
+
+    def _acquire_session(self) -> "requests.Session":
+        """Take an idle HTTP session from the pool, creating one if none is free.
+
+        Reusing sessions keeps connections alive between requests, so
+        paginated and repeated calls skip the TCP/TLS handshake. Each request
+        holds its session exclusively, because ``requests.Session`` is not
+        thread-safe and Ideas and MarketMovers issue requests from worker
+        threads that share the instance. ``list.pop`` and ``list.append`` are
+        atomic, so the pool needs no lock.
+
+        Pooled sessions never store cookies, so every request is sent exactly
+        as a one-off ``requests.request`` call would be.
+        """
+        try:
+            return self._idle_sessions.pop()
+        except IndexError:
+            import requests
+
+            session = requests.Session()
+            session.cookies.set_policy(
+                http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+            )
+            return session
+
+    def close(self) -> None:
+        """Close the scraper's idle HTTP sessions and their pooled connections.
+
+        The scraper stays usable; new sessions are opened on the next request.
+        """
+        while True:
+            try:
+                session = self._idle_sessions.pop()
+            except IndexError:
+                return
+            session.close()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return picklable state, leaving out the open HTTP sessions."""
+        state = self.__dict__.copy()
+        state["_idle_sessions"] = []
+        return state
+
+    def _is_captcha(self, response: "requests.Response") -> bool:
+        """Return whether a response is TradingView's captcha challenge page.
+
+        Searches the raw body bytes so the check never decodes the whole
+        body to text, which for JSON responses without a declared charset
+        would also run encoding detection.
+
+        Args:
+            response: The HTTP response to inspect.
+
+        Returns:
+            ``True`` if the body contains the captcha page title.
+        """
+        return _CAPTCHA_MARKER_BYTES in response.content
+
+    def _parse_json(self, response: "requests.Response") -> Any:
+        """Decode a JSON response body, preferring ``orjson`` when installed.
+
+        Args:
+            response: The HTTP response to decode.
+
+        Returns:
+            The decoded JSON value.
+
+        Raises:
+            ValueError: If the body is not valid JSON.
+        """
+        return parse_json(response)
 
     def _export(
         self,
@@ -135,7 +224,7 @@ class BaseScraper:
         self,
         exchange: str,
         symbol: str,
-        fields: list[str],
+        fields: Sequence[str],
         data_category: str,
     ) -> dict[str, Any]:
         """Fetch field values for a symbol from the TradingView scanner API.
@@ -170,7 +259,7 @@ class BaseScraper:
 
         try:
             response = self._make_request(url, method="GET", params=params)
-            json_response: dict[str, Any] = response.json()
+            json_response: dict[str, Any] = self._parse_json(response)
         except NetworkError as exc:
             return self._error_response(str(exc))
         except (ValueError, KeyError) as exc:
@@ -211,11 +300,11 @@ class BaseScraper:
         Returns:
             List of dicts with ``symbol`` key and field-named values.
         """
+        template = _row_template(tuple(fields))
         result: list[dict[str, Any]] = []
         for item in items:
-            row: dict[str, Any] = {"symbol": item.get("s", "")}
-            values = item.get("d", [])
-            for i, field in enumerate(fields):
-                row[field] = values[i] if i < len(values) else None
+            # Missing trailing values keep the template's None
+            row: dict[str, Any] = {"symbol": item.get("s", ""), **template}
+            row.update(zip(fields, item.get("d", []), strict=False))
             result.append(row)
         return result
@@ -225,7 +225,7 @@ class Calendar(BaseScraper):
         # Execute request
         try:
             response = self._make_request(url, method="POST", json_data=payload)
-            json_response: dict[str, Any] = response.json()
+            json_response: dict[str, Any] = self._parse_json(response)
         except NetworkError as exc:
             return self._error_response(str(exc))
         except (ValueError, KeyError) as exc:
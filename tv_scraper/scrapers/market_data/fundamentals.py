@@ -1,5 +1,6 @@
 """Fundamentals scraper for fetching financial data from TradingView."""
 
+from collections.abc import Sequence
 from typing import Any
 
 from tv_scraper.core.base import BaseScraper
@@ -25,7 +26,7 @@ class Fundamentals(BaseScraper):
         data = scraper.get_fundamentals(exchange="NASDAQ", symbol="AAPL")
     """
 
-    INCOME_STATEMENT_FIELDS: list[str] = [
+    INCOME_STATEMENT_FIELDS: tuple[str, ...] = (
         "total_revenue",
         "revenue_per_share_ttm",
         "total_revenue_fy",
@@ -39,9 +40,9 @@ class Fundamentals(BaseScraper):
         "basic_eps_net_income",
         "earnings_per_share_basic_ttm",
         "earnings_per_share_diluted_ttm",
-    ]
+    )
 
-    BALANCE_SHEET_FIELDS: list[str] = [
+    BALANCE_SHEET_FIELDS: tuple[str, ...] = (
         "total_assets",
         "total_assets_fy",
         "cash_n_short_term_invest",
@@ -51,9 +52,9 @@ class Fundamentals(BaseScraper):
         "stockholders_equity",
         "stockholders_equity_fy",
         "book_value_per_share_fq",
-    ]
+    )
 
-    CASH_FLOW_FIELDS: list[str] = [
+    CASH_FLOW_FIELDS: tuple[str, ...] = (
         "cash_f_operating_activities",
         "cash_f_operating_activities_fy",
         "cash_f_investing_activities",
@@ -61,9 +62,9 @@ class Fundamentals(BaseScraper):
         "cash_f_financing_activities",
         "cash_f_financing_activities_fy",
         "free_cash_flow",
-    ]
+    )
 
-    MARGIN_FIELDS: list[str] = [
+    MARGIN_FIELDS: tuple[str, ...] = (
         "gross_margin",
         "gross_margin_percent_ttm",
         "operating_margin",
@@ -72,30 +73,30 @@ class Fundamentals(BaseScraper):
         "net_margin",
         "net_margin_percent_ttm",
         "EBITDA_margin",
-    ]
+    )
 
-    PROFITABILITY_FIELDS: list[str] = [
+    PROFITABILITY_FIELDS: tuple[str, ...] = (
         "return_on_equity",
         "return_on_equity_fq",
         "return_on_assets",
         "return_on_assets_fq",
         "return_on_investment_ttm",
-    ]
+    )
 
-    LIQUIDITY_FIELDS: list[str] = [
+    LIQUIDITY_FIELDS: tuple[str, ...] = (
         "current_ratio",
         "current_ratio_fq",
         "quick_ratio",
         "quick_ratio_fq",
-    ]
+    )
 
-    LEVERAGE_FIELDS: list[str] = [
+    LEVERAGE_FIELDS: tuple[str, ...] = (
         "debt_to_equity",
         "debt_to_equity_fq",
         "debt_to_assets",
-    ]
+    )
 
-    VALUATION_FIELDS: list[str] = [
+    VALUATION_FIELDS: tuple[str, ...] = (
         "market_cap_basic",
         "market_cap_calc",
         "market_cap_diluted_calc",
@@ -104,15 +105,15 @@ class Fundamentals(BaseScraper):
         "price_book_fq",
         "price_sales_ttm",
         "price_free_cash_flow_ttm",
-    ]
+    )
 
-    DIVIDEND_FIELDS: list[str] = [
+    DIVIDEND_FIELDS: tuple[str, ...] = (
         "dividends_yield",
         "dividends_per_share_fq",
         "dividend_payout_ratio_ttm",
-    ]
+    )
 
-    ALL_FIELDS: list[str] = (
+    ALL_FIELDS: tuple[str, ...] = (
         INCOME_STATEMENT_FIELDS
         + BALANCE_SHEET_FIELDS
         + CASH_FLOW_FIELDS
@@ -124,8 +125,13 @@ class Fundamentals(BaseScraper):
         + DIVIDEND_FIELDS
     )
 
+    # Fields combined by get_statistics, precomputed once
+    STATISTICS_FIELDS: tuple[str, ...] = (
+        LIQUIDITY_FIELDS + LEVERAGE_FIELDS + VALUATION_FIELDS
+    )
+
     # Default fields used for multi-symbol comparison when none specified
-    DEFAULT_COMPARISON_FIELDS: list[str] = [
+    DEFAULT_COMPARISON_FIELDS: tuple[str, ...] = (
         "total_revenue",
         "net_income",
         "EBITDA",
@@ -133,13 +139,13 @@ class Fundamentals(BaseScraper):
         "price_earnings_ttm",
         "return_on_equity_fq",
         "debt_to_equity_fq",
-    ]
+    )
 
     def get_fundamentals(
         self,
         exchange: str,
         symbol: str,
-        fields: list[str] | None = None,
+        fields: Sequence[str] | None = None,
     ) -> dict[str, Any]:
         """Get fundamental financial data for a symbol.
 
@@ -164,7 +170,7 @@ class Fundamentals(BaseScraper):
     def compare_fundamentals(
         self,
         symbols: list[dict[str, str]],
-        fields: list[str] | None = None,
+        fields: Sequence[str] | None = None,
     ) -> dict[str, Any]:
         """Compare fundamental data across multiple symbols.
 
@@ -278,8 +284,9 @@ class Fundamentals(BaseScraper):
         Returns:
             Statistics data including ratios and valuation metrics.
         """
-        fields = self.LIQUIDITY_FIELDS + self.LEVERAGE_FIELDS + self.VALUATION_FIELDS
-        return self.get_fundamentals(exchange=exchange, symbol=symbol, fields=fields)
+        return self.get_fundamentals(
+            exchange=exchange, symbol=symbol, fields=self.STATISTICS_FIELDS
+        )
 
     def get_dividends(self, exchange: str, symbol: str) -> dict[str, Any]:
         """Get dividend information for a symbol.
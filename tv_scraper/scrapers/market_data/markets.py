@@ -124,7 +124,7 @@ class Markets(BaseScraper):
         # --- request ---------------------------------------------------
         try:
             response = self._make_request(url, method="POST", json_data=payload)
-            json_data = response.json()
+            json_data = self._parse_json(response)
         except Exception as exc:
             return self._error_response(str(exc))
 
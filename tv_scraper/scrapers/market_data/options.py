@@ -170,7 +170,7 @@ class Options(BaseScraper):
                 )
 
             response.raise_for_status()
-            json_response = response.json()
+            json_response = self._parse_json(response)
         except NetworkError as exc:
             return self._error_response(str(exc))
         except (ValueError, KeyError) as exc:
@@ -190,10 +190,7 @@ class Options(BaseScraper):
         formatted_data = []
         for item in raw_symbols:
             option_data = {"symbol": item.get("s")}
-            values = item.get("f", [])
-            for i, field in enumerate(fields):
-                if i < len(values):
-                    option_data[field] = values[i]
+            option_data.update(zip(fields, item.get("f", []), strict=False))
             formatted_data.append(option_data)
 
         # Export if requested
@@ -105,7 +105,7 @@ class Technicals(BaseScraper):
         # --- Execute request ---
         try:
             response = self._make_request(url, method="GET", params=params)
-            json_response: dict[str, Any] = response.json()
+            json_response: dict[str, Any] = self._parse_json(response)
         except NetworkError as exc:
             return self._error_response(str(exc))
         except (ValueError, KeyError) as exc:
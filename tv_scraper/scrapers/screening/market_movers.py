@@ -1,14 +1,18 @@
 """Market Movers module for scraping top gainers, losers, and active instruments."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from tv_scraper.core.base import BaseScraper
-from tv_scraper.core.constants import SCANNER_URL
+from tv_scraper.core.constants import SCANNER_URL, STATUS_SUCCESS
 from tv_scraper.core.exceptions import NetworkError
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on categories fetched in parallel by get_market_movers_batch
+MAX_CATEGORY_WORKERS = 4
+
 
 class MarketMovers(BaseScraper):
     """Scrape market movers (gainers, losers, most active, etc.) from TradingView.
@@ -99,6 +103,19 @@ class MarketMovers(BaseScraper):
         "after-hours-losers": {"sortBy": "change", "sortOrder": "asc"},
     }
 
+    _DEFAULT_SORT: dict[str, str] = {"sortBy": "change", "sortOrder": "desc"}
+
+    # Category-specific filter condition, added after the market filter
+    _CATEGORY_FILTER: dict[str, dict[str, Any]] = {
+        "penny-stocks": {"left": "close", "operation": "less", "right": 5},
+        "gainers": {"left": "change", "operation": "greater", "right": 0},
+        "pre-market-gainers": {"left": "change", "operation": "greater", "right": 0},
+        "after-hours-gainers": {"left": "change", "operation": "greater", "right": 0},
+        "losers": {"left": "change", "operation": "less", "right": 0},
+        "pre-market-losers": {"left": "change", "operation": "less", "right": 0},
+        "after-hours-losers": {"left": "change", "operation": "less", "right": 0},
+    }
+
     def _get_scanner_url(self, market: str) -> str:
         """Return the scanner API URL for the given market.
 
@@ -120,9 +137,7 @@ class MarketMovers(BaseScraper):
         Returns:
             Sort config dict with ``sortBy`` and ``sortOrder`` keys.
         """
-        return dict(
-            self._CATEGORY_SORT.get(category, {"sortBy": "change", "sortOrder": "desc"})
-        )
+        return dict(self._CATEGORY_SORT.get(category, self._DEFAULT_SORT))
 
     def _get_filter_conditions(
         self, market: str, category: str
@@ -146,20 +161,9 @@ class MarketMovers(BaseScraper):
             )
 
         # Category-specific filters
-        if category == "penny-stocks":
-            filters.append({"left": "close", "operation": "less", "right": 5})
-        elif category in (
-            "gainers",
-            "pre-market-gainers",
-            "after-hours-gainers",
-        ):
-            filters.append({"left": "change", "operation": "greater", "right": 0})
-        elif category in (
-            "losers",
-            "pre-market-losers",
-            "after-hours-losers",
-        ):
-            filters.append({"left": "change", "operation": "less", "right": 0})
+        condition = self._CATEGORY_FILTER.get(category)
+        if condition is not None:
+            filters.append(dict(condition))
 
         return filters
 
@@ -189,6 +193,34 @@ class MarketMovers(BaseScraper):
             "sort": self._get_sort_config(category),
         }
 
+    def _validate_market_category(self, market: str, category: str) -> str | None:
+        """Check that a market/category pair is supported.
+
+        Args:
+            market: Market identifier.
+            category: Category identifier.
+
+        Returns:
+            An error message, or ``None`` if the pair is supported.
+        """
+        if market not in self.SUPPORTED_MARKETS:
+            return (
+                f"Unsupported market: '{market}'. "
+                f"Supported markets: {', '.join(self.SUPPORTED_MARKETS)}"
+            )
+
+        allowed = (
+            self.STOCK_CATEGORIES
+            if market.startswith("stocks")
+            else self.NON_STOCK_CATEGORIES
+        )
+        if category not in allowed:
+            return (
+                f"Unsupported category: '{category}'. "
+                f"Supported categories: {', '.join(allowed)}"
+            )
+        return None
+
     def get_market_movers(
         self,
         market: str = "stocks-usa",
@@ -208,43 +240,48 @@ class MarketMovers(BaseScraper):
             Standardized response envelope with ``status``, ``data``,
             ``metadata``, and ``error`` keys.
         """
-        # Validate market
-        if market not in self.SUPPORTED_MARKETS:
-            return self._error_response(
-                f"Unsupported market: '{market}'. "
-                f"Supported markets: {', '.join(self.SUPPORTED_MARKETS)}"
+        error = self._validate_market_category(market, category)
+        if error:
+            return self._error_response(error)
+
+        result = self._fetch_movers(market, category, fields, limit)
+        if result["status"] == STATUS_SUCCESS and self.export_result:
+            self._export(
+                data=result["data"],
+                symbol=f"{market}_{category}",
+                data_category="market_movers",
             )
+        return result
 
-        # Validate category
-        allowed = (
-            self.STOCK_CATEGORIES
-            if market.startswith("stocks")
-            else self.NON_STOCK_CATEGORIES
-        )
-        if category not in allowed:
-            return self._error_response(
-                f"Unsupported category: '{category}'. "
-                f"Supported categories: {', '.join(allowed)}"
-            )
+    def _fetch_movers(
+        self,
+        market: str,
+        category: str,
+        fields: list[str] | None,
+        limit: int,
+    ) -> dict[str, Any]:
+        """Fetch one already-validated market/category pair, without exporting.
 
+        Args:
+            market: Market identifier.
+            category: Category identifier.
+            fields: Columns to retrieve. Defaults to ``DEFAULT_FIELDS``.
+            limit: Maximum number of results.
+
+        Returns:
+            Standardized response envelope.
+        """
         resolved_fields = fields if fields is not None else list(self.DEFAULT_FIELDS)
         payload = self._build_payload(market, category, resolved_fields, limit)
         url = self._get_scanner_url(market)
 
         try:
             response = self._make_request(url, method="POST", json_data=payload)
-            json_response = response.json()
+            json_response = self._parse_json(response)
 
             raw_items = json_response.get("data", [])
             formatted_data = self._map_scanner_rows(raw_items, resolved_fields)
 
-            if self.export_result:
-                self._export(
-                    data=formatted_data,
-                    symbol=f"{market}_{category}",
-                    data_category="market_movers",
-                )
-
             return self._success_response(
                 formatted_data,
                 market=market,
@@ -255,3 +292,79 @@ class MarketMovers(BaseScraper):
             return self._error_response(str(exc))
         except Exception as exc:
             return self._error_response(f"Request failed: {exc}")
+
+    def get_market_movers_batch(
+        self,
+        market: str = "stocks-usa",
+        categories: list[str] | None = None,
+        fields: list[str] | None = None,
+        limit: int = 50,
+    ) -> dict[str, Any]:
+        """Scrape several movers categories for one market in parallel.
+
+        Each category has its own filter and sort order, so it is still one
+        scanner request per category, but the requests run concurrently.
+        Duplicate categories are fetched once. When ``export_result`` is
+        set, the batch is exported as one file whose rows carry a
+        ``category`` column.
+
+        Args:
+            market: The market to scrape (e.g. ``"stocks-usa"``, ``"crypto"``).
+            categories: Categories to fetch. ``None`` fetches ``["gainers",
+                "losers", "most-active"]``; an empty list is an error.
+            fields: Columns to retrieve. Defaults to ``DEFAULT_FIELDS``.
+            limit: Maximum number of results per category (default 50).
+
+        Returns:
+            Standardized response envelope whose ``data`` maps each category
+            to its list of rows. Fails as a whole if any category fails.
+        """
+        if categories is None:
+            requested = list(self.NON_STOCK_CATEGORIES)
+        else:
+            requested = list(dict.fromkeys(categories))
+        if not requested:
+            return self._error_response("No categories requested.")
+
+        for category in requested:
+            error = self._validate_market_category(market, category)
+            if error:
+                return self._error_response(error)
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(requested), MAX_CATEGORY_WORKERS)
+        ) as executor:
+            results = list(
+                executor.map(
+                    lambda category: self._fetch_movers(
+                        market, category, fields, limit
+                    ),
+                    requested,
+                )
+            )
+
+        data: dict[str, list[dict[str, Any]]] = {}
+        for category, result in zip(requested, results, strict=True):
+            if result["status"] != STATUS_SUCCESS:
+                return self._error_response(
+                    f"Failed to fetch category '{category}': {result['error']}"
+                )
+            data[category] = result["data"]
+
+        if self.export_result:
+            self._export(
+                data=[
+                    {"category": category, **row}
+                    for category, rows in data.items()
+                    for row in rows
+                ],
+                symbol=f"{market}_batch",
+                data_category="market_movers",
+            )
+
+        return self._success_response(
+            data,
+            market=market,
+            categories=requested,
+            total=sum(len(rows) for rows in data.values()),
+        )
@@ -125,7 +125,7 @@ class SymbolMarkets(BaseScraper):
 
         try:
             response = self._make_request(url, method="POST", json_data=payload)
-            json_response = response.json()
+            json_response = self._parse_json(response)
 
             raw_items = json_response.get("data", [])
             formatted_data = self._map_scanner_rows(raw_items, resolved_fields)
@@ -14,6 +14,9 @@ logger = logging.getLogger(__name__)
 
 ALLOWED_SORT_VALUES = {"popular", "recent"}
 
+# Upper bound on pages fetched in parallel
+MAX_PAGE_WORKERS = 3
+
 
 class Ideas(BaseScraper):
     """Scraper for trading ideas published on TradingView.
@@ -50,6 +53,8 @@ class Ideas(BaseScraper):
             timeout=timeout,
         )
         self._cookie: str | None = cookie or os.environ.get("TRADINGVIEW_COOKIE")
+        if self._cookie:
+            self._headers["cookie"] = self._cookie
 
     def get_ideas(
         self,
@@ -83,19 +88,20 @@ class Ideas(BaseScraper):
         # Build the URL slug (TV uses HYPHEN for combined symbols in URLs)
         url_slug = f"{exchange}-{symbol}"
 
-        # Apply cookie header if available
-        headers = dict(self._headers)
-        if self._cookie:
-            headers["cookie"] = self._cookie
-
         page_list = list(range(start_page, end_page + 1))
-        articles: list[dict[str, Any]] = []
+        page_results: dict[int, list[dict[str, Any]]] = {}
 
         # --- Concurrent page scraping ---
-        with ThreadPoolExecutor(max_workers=3) as executor:
+        # Pages still queued are cancelled as soon as one page fails, so a
+        # captcha on page 1 does not wait for the rest of the range. Pages
+        # already in flight are waited for, so no request outlives the call.
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(len(page_list), MAX_PAGE_WORKERS))
+        )
+        try:
             futures = {
                 executor.submit(
-                    self._scrape_page, url_slug, page, sort_by, headers
+                    self._scrape_page, url_slug, page, sort_by, self._headers
                 ): page
                 for page in page_list
             }
@@ -109,12 +115,17 @@ class Ideas(BaseScraper):
                             f"Captcha challenge encountered on page {page}. "
                             "Try updating the TRADINGVIEW_COOKIE.",
                         )
-                    articles.extend(result)
+                    page_results[page] = result
                 except Exception as exc:
                     logger.error("Failed to scrape page %d: %s", page, exc)
                     return self._error_response(
                         f"Failed to scrape page {page}: {exc}",
                     )
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        # Keep ideas in page order regardless of completion order
+        articles = [idea for page in page_list for idea in page_results[page]]
 
         # --- Export ---
         if self.export_result:
@@ -173,7 +184,7 @@ class Ideas(BaseScraper):
                 )
                 raise Exception(f"HTTP {response.status_code}")
 
-            if "<title>Captcha Challenge</title>" in response.text:
+            if self._is_captcha(response):
                 logger.error(
                     "Captcha challenge on page %d of %s",
                     page,
@@ -181,7 +192,7 @@ class Ideas(BaseScraper):
                 )
                 return None
 
-            data = response.json()
+            data = self._parse_json(response)
             ideas_data = data.get("data", {}).get("ideas", {}).get("data", {})
             items = ideas_data.get("items", [])
 
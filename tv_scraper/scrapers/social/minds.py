@@ -79,7 +79,7 @@ class Minds(BaseScraper):
                         f"HTTP {response.status_code}: {response.text}"
                     )
 
-                json_response = response.json()
+                json_response = self._parse_json(response)
                 results = json_response.get("results", [])
 
                 if not results:
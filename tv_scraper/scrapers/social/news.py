@@ -141,7 +141,7 @@ class News(BaseScraper):
             response.raise_for_status()
 
             # Check captcha
-            if "<title>Captcha Challenge</title>" in response.text:
+            if self._is_captcha(response):
                 logger.error(
                     "Captcha Challenge encountered for %s on %s.",
                     symbol,
@@ -152,7 +152,7 @@ class News(BaseScraper):
                     "Try updating the TRADINGVIEW_COOKIE."
                 )
 
-            response_json = response.json()
+            response_json = self._parse_json(response)
             items: list[dict[str, Any]] = response_json.get("items", [])
 
             if not items:
@@ -217,7 +217,7 @@ class News(BaseScraper):
             )
             response.raise_for_status()
 
-            story_data = response.json()
+            story_data = self._parse_json(response)
 
             # Parse the story data
             article_data = self._parse_story(story_data)
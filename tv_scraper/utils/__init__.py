@@ -1,7 +1,7 @@
 """Utility modules for tv_scraper."""
 
 from tv_scraper.utils.helpers import format_symbol, generate_user_agent
-from tv_scraper.utils.http import make_request
+from tv_scraper.utils.http import make_request, parse_json
 from tv_scraper.utils.io import (
     ensure_export_directory,
     generate_export_filepath,
@@ -15,6 +15,7 @@ __all__ = [
     "generate_export_filepath",
     "generate_user_agent",
     "make_request",
+    "parse_json",
     "save_csv_file",
     "save_json_file",
 ]
@@ -5,6 +5,11 @@ from typing import Any
 
 import requests
 
+try:
+    import orjson
+except ImportError:  # optional speedup, installed with the ``fast`` extra
+    orjson = None  # type: ignore[assignment]
+
 from tv_scraper.core.constants import DEFAULT_TIMEOUT
 from tv_scraper.core.exceptions import NetworkError
 
@@ -19,6 +24,7 @@ def make_request(
     params: dict[str, Any] | None = None,
     json_data: dict[str, Any] | None = None,
     timeout: int = DEFAULT_TIMEOUT,
+    session: requests.Session | None = None,
 ) -> requests.Response:
     """Make an HTTP request with error handling.
 
@@ -29,6 +35,8 @@ def make_request(
         params: Optional query parameters.
         json_data: Optional JSON body for POST requests.
         timeout: Request timeout in seconds.
+        session: Optional session whose connection pool is reused across
+            requests. A one-off connection is used when omitted.
 
     Returns:
         The HTTP response.
@@ -38,7 +46,8 @@ def make_request(
     """
     response: requests.Response | None = None
     try:
-        response = requests.request(
+        send = session.request if session is not None else requests.request
+        response = send(
             method=method,
             url=url,
             headers=headers,
@@ -57,3 +66,28 @@ def make_request(
         raise NetworkError(f"HTTP error {status} for {url}: {e}") from e
     except requests.exceptions.RequestException as e:
         raise NetworkError(f"Request failed for {url}: {e}") from e
+
+
+def parse_json(response: requests.Response) -> Any:
+    """Decode a response body as JSON.
+
+    Uses ``orjson`` on the raw body when it is installed and falls back to
+    ``response.json()`` otherwise. Bodies ``orjson`` rejects, such as ones
+    containing ``NaN`` or ``Infinity``, are retried with ``response.json()``,
+    so both paths accept the same input and raise the same error.
+
+    Args:
+        response: The HTTP response to decode.
+
+    Returns:
+        The decoded JSON value.
+
+    Raises:
+        requests.JSONDecodeError: If the body is not valid JSON.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            pass
+    return response.json()